@@ -54,8 +54,8 @@ class DeveloperAgent:
         ]
 
         # MongoDB - delegate to workflow
-        self.mongo_client = self.jira_workflow.mongo_client
         self.mongo_collection = self.jira_workflow.mongo_collection
+        self.mongo_client = self.mongo_collection.database.client if self.mongo_collection is not None else None
 
         logger.debug("Developer Agent initialized (using modular architecture)")
 
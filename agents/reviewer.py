@@ -15,7 +15,6 @@ from datetime import datetime
 from threading import Lock
 
 # Import the new modular components
-from agents.core_reviewer_agent import CoreReviewerAgent
 from workflows.jira_reviewer_workflow import JiraReviewerWorkflow
 
 logger = logging.getLogger(__name__)
@@ -38,9 +37,9 @@ class SimplifiedReviewer:
         """Initialize the simplified reviewer module."""
         self.config = config
 
-        # Initialize modular components
-        self.core_reviewer = CoreReviewerAgent(config)
-        self.jira_workflow = JiraReviewerWorkflow(config)
+        # Initialize modular components (the shared workflow's core reviewer runs every review)
+        self.jira_workflow = JiraReviewerWorkflow.get_shared(config)
+        self.core_reviewer = self.jira_workflow.core_reviewer
 
         # For backward compatibility - expose the workflow and tools
         self.workflow = self.core_reviewer.graph
@@ -91,6 +90,19 @@ class SimplifiedReviewer:
             thread_id = str(threading.current_thread().ident)[-6:]
 
         try:
+            if review_queue is not None and not files:
+                # Parallel path with nothing to fall back on - everything comes from the queue
+                result = self.jira_workflow.review_from_queue(
+                    review_queue,
+                    issue_key=issue_key,
+                    project_description=project_description,
+                    file_types=file_types or None,
+                    iteration=iteration,
+                    thread_id=thread_id
+                )
+                self.workflow_stats = self.core_reviewer.review_stats
+                return result
+
             # Use JIRA workflow for issue-based reviews
             result = self.jira_workflow.review_jira_issue_code(
                 issue_key=issue_key,
@@ -51,6 +51,10 @@ class Config:
     REVIEWER_LLM_TEMPERATURE = float(os.getenv("REVIEWER_LLM_TEMPERATURE", DEFAULT_LLM_TEMPERATURE))
     REVIEWER_LLM_MAX_TOKENS = int(os.getenv("REVIEWER_LLM_MAX_TOKENS")) if os.getenv("REVIEWER_LLM_MAX_TOKENS") else DEFAULT_LLM_MAX_TOKENS
 
+    # LLM Rate Limiting (per provider URL, 0 disables the limit)
+    LLM_RATE_LIMIT_RPM = int(os.getenv("LLM_RATE_LIMIT_RPM", 500))
+    LLM_RATE_LIMIT_TPM = int(os.getenv("LLM_RATE_LIMIT_TPM", 0))
+
     # Agentic ui Configuration
     UI_HOST = os.getenv("UI_HOST")
     UI_PORT = int(os.getenv("UI_PORT"))
@@ -73,6 +77,7 @@ class Config:
     MONGODB_PERFORMANCE_DATABASE = os.getenv("MONGODB_PERFORMANCE_DATABASE")
     MONGODB_AGENT_PERFORMANCE = os.getenv("MONGODB_AGENT_PERFORMANCE")
     MONGODB_REVIEWER_COLLECTION = os.getenv("MONGODB_REVIEWER_COLLECTION")
+    MONGODB_SCORE_CACHE_COLLECTION = os.getenv("MONGODB_SCORE_CACHE_COLLECTION", "pylint_score_cache")
     MONGODB_URI = os.getenv("MONGODB_CONNECTION_STRING")  # Alias for ui compatibility
     MONGODB_ENABLED = os.getenv("MONGODB_ENABLED", "True").lower() == "true"
 
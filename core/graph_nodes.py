@@ -524,8 +524,8 @@ class WorkflowNodes:
         try:
             start_time = time.time()
 
-            # NEW: Create queue for file handoff
-            review_queue = queue.Queue()
+            # NEW: Create queue for file handoff (SimpleQueue: C-implemented, no lock/condition overhead per put)
+            review_queue = queue.SimpleQueue()
             state["review_queue"] = review_queue  # Pass to state for reviewer
 
             # Run developer with queue
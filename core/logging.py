@@ -1,5 +1,8 @@
+import atexit
 import logging
-from typing import Dict, Any, List
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, List, Optional
 from threading import Lock
 
 logging.basicConfig(
@@ -8,6 +11,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Records buffered between the calling threads and the background log writer
+LOG_QUEUE_SIZE = 10000
+_log_listener: Optional[QueueListener] = None
+
 stats_lock = Lock()
 activity_lock = Lock()
 
@@ -48,4 +55,24 @@ def safe_activity_log(entry: Dict[str, Any]) -> None:
     with activity_lock:
         activity_logs.insert(0, entry)  # Insert at beginning for reverse chronological
         if len(activity_logs) > 50:  # Keep last 50 logs
-            activity_logs.pop()
\ No newline at end of file
+            activity_logs.pop()
+
+def setup_async_logging(queue_size: int = LOG_QUEUE_SIZE) -> QueueListener:
+    """
+    Move log I/O off the calling threads: the root logger's handlers are handed to a
+    QueueListener thread and replaced with a single QueueHandler. Safe to call more than once.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue = queue.Queue(maxsize=queue_size)
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    return _log_listener
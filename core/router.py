@@ -116,6 +116,9 @@ processing_stats = {
 
 # Global activity logs
 activity_logs: List[Dict[str, Any]] = []
+# Number of active consumers of activity_logs (the UI server registers itself); producers may skip
+# building rich log entries while this is 0
+LISTENERS = 0
 
 stats_lock = Lock()
 activity_lock = Lock()
@@ -144,6 +147,29 @@ def safe_activity_log(entry: Dict[str, Any]) -> None:
             activity_logs.pop()
 
 
+def safe_activity_log_bulk(entries: List[Dict[str, Any]]) -> None:
+    """Thread-safe append of several activity log entries (oldest first) under one lock acquisition"""
+    if not entries:
+        return
+    with activity_lock:
+        activity_logs[:0] = entries[::-1]  # Newest first, matching safe_activity_log
+        del activity_logs[50:]  # Keep last 50 logs
+
+
+def register_activity_listener() -> None:
+    """Register a consumer of the activity log"""
+    global LISTENERS
+    with activity_lock:
+        LISTENERS += 1
+
+
+def unregister_activity_listener() -> None:
+    """Unregister a consumer of the activity log"""
+    global LISTENERS
+    with activity_lock:
+        LISTENERS = max(0, LISTENERS - 1)
+
+
 class LangGraphRouter:
     """LangGraph-based router orchestrating the complete workflow"""
 
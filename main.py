@@ -3,12 +3,15 @@ import webbrowser
 import time
 from core.router import initialize_system, run_system, shutdown_system
 from ui.ui import start_ui_server, stop_ui_server, config
+from core.logging import setup_async_logging
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - [%(threadName)s] - %(message)s'
 )
+# Handlers run on a background listener thread so logging never blocks the workflows
+setup_async_logging()
 logger = logging.getLogger(__name__)
 
 def main():
@@ -5,8 +5,11 @@ Universal provider support - works with ANY LLM API
 Each agent creates its own service instance for concurrent processing
 Async implementation for high performance
 """
+import atexit
 import logging
 import asyncio
+import threading
+import time
 import aiohttp
 import tiktoken
 from typing import Tuple, Optional, Dict, Any
@@ -14,6 +17,16 @@ from config.settings import config
 
 logger = logging.getLogger(__name__)
 
+# Shared event loop + pooled HTTP session - every call_llm reuses keep-alive connections
+# instead of paying a new TCP/TLS handshake per call
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_loop_lock = threading.Lock()
+
+# Per-provider rate limiters (keyed by API URL)
+_rate_limiters: Dict[str, "TokenBucket"] = {}
+_rate_limiters_lock = threading.Lock()
+
 # Statistics tracking
 llm_stats = {
     'total_calls': 0,
@@ -29,6 +42,121 @@ llm_stats = {
 }
 
 
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop that owns the pooled HTTP session"""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None or _shared_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="llm-io-loop", daemon=True).start()
+            _shared_loop = loop
+        return _shared_loop
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the pooled aiohttp session (only ever touched from the shared loop)"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, keepalive_timeout=60)
+        _shared_session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=180))
+    return _shared_session
+
+
+@atexit.register
+def _close_shared_loop():
+    """Close the pooled session and stop the background loop on interpreter exit"""
+    loop = _shared_loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        if _shared_session is not None and not _shared_session.closed:
+            asyncio.run_coroutine_threadsafe(_shared_session.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.debug(f"Error closing shared LLM session: {e}")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class TokenBucket:
+    """
+    Adaptive async token bucket for requests/min and tokens/min.
+
+    Halves its refill rate on HTTP 429 and recovers exponentially on success, and
+    clamps its budget to the provider's x-ratelimit-remaining-* headers when present.
+    """
+
+    MIN_RATE_SCALE = 1 / 16
+    RECOVERY_FACTOR = 1.25
+
+    def __init__(self, rpm: int, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.rate_scale = 1.0
+        self.r_tokens = float(rpm)
+        self.t_tokens = float(tpm)
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.r_tokens = min(self.rpm, self.r_tokens + elapsed * self.rpm * self.rate_scale / 60.0)
+        if self.tpm:
+            self.t_tokens = min(self.tpm, self.t_tokens + elapsed * self.tpm * self.rate_scale / 60.0)
+
+    async def acquire(self, est_tokens: int = 0):
+        """Wait until one request and est_tokens tokens are available, then consume them"""
+        if self.rpm <= 0:
+            return
+        est_tokens = min(est_tokens, self.tpm) if self.tpm else 0
+
+        while True:
+            self._refill()
+            if self.r_tokens >= 1 and self.t_tokens >= est_tokens:
+                self.r_tokens -= 1
+                self.t_tokens -= est_tokens
+                return
+
+            # Sleep just long enough for the larger deficit to refill
+            wait_time = max(1 - self.r_tokens, 0) * 60.0 / (self.rpm * self.rate_scale)
+            if self.tpm:
+                wait_time = max(wait_time, (est_tokens - self.t_tokens) * 60.0 / (self.tpm * self.rate_scale))
+            await asyncio.sleep(max(wait_time, 0.01))
+
+    def on_rate_limited(self):
+        """Provider returned 429 - halve the rate and drain the current budget"""
+        self.rate_scale = max(self.rate_scale / 2, self.MIN_RATE_SCALE)
+        self.r_tokens = min(self.r_tokens, 0.0)
+        logger.warning(f"LLM rate limit hit - limiter now at {self.rate_scale:.0%} of configured rate")
+
+    def on_success(self, headers: Optional[Any] = None):
+        """Recover towards the configured rate and sync with provider rate-limit headers"""
+        self.rate_scale = min(1.0, self.rate_scale * self.RECOVERY_FACTOR)
+        if not headers:
+            return
+        try:
+            remaining_requests = headers.get('x-ratelimit-remaining-requests')
+            if remaining_requests is not None:
+                self.r_tokens = min(self.r_tokens, float(remaining_requests))
+            remaining_tokens = headers.get('x-ratelimit-remaining-tokens')
+            if remaining_tokens is not None and self.tpm:
+                self.t_tokens = min(self.t_tokens, float(remaining_tokens))
+        except (TypeError, ValueError):
+            pass
+
+
+def get_rate_limiter(api_url: str) -> TokenBucket:
+    """Get the shared rate limiter for a provider URL"""
+    limiter = _rate_limiters.get(api_url)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(api_url)
+            if limiter is None:
+                limiter = TokenBucket(config.LLM_RATE_LIMIT_RPM, config.LLM_RATE_LIMIT_TPM)
+                _rate_limiters[api_url] = limiter
+    return limiter
+
+
 class LLMService:
     """Unified async LLM service supporting all providers"""
 
@@ -49,16 +177,19 @@ class LLMService:
         self.api_key = api_key
         self.api_url = api_url
         self._session = None
+        self._rate_limiter = get_rate_limiter(api_url)
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
+        """Get the pooled session on the shared loop, otherwise a per-instance aiohttp session"""
+        if asyncio.get_running_loop() is _shared_loop:
+            return await _get_shared_session()
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=180)
             self._session = aiohttp.ClientSession(timeout=timeout)
         return self._session
 
     async def close(self):
-        """Close the aiohttp session"""
+        """Close the per-instance aiohttp session (the pooled shared session stays open)"""
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -100,8 +231,8 @@ class LLMService:
         # Call provider with retries
         for attempt in range(max_retries):
             try:
-                # Rate limiting
-                await asyncio.sleep(0.1)
+                # Rate limiting (rough estimate: ~4 chars per token)
+                await self._rate_limiter.acquire(est_tokens=len(prompt) // 4)
 
                 # Universal provider call - detects format from API URL
                 content, tokens = await self._call_provider(
@@ -119,6 +250,7 @@ class LLMService:
 
             except aiohttp.ClientResponseError as e:
                 if e.status == 429:  # Rate limit
+                    self._rate_limiter.on_rate_limited()
                     if attempt < max_retries - 1:
                         wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
                         logger.warning(
@@ -154,32 +286,16 @@ class LLMService:
         max_retries: int = 3,
         retry_delay: float = 2.0
     ) -> Tuple[str, int]:
-        """Synchronous wrapper for async call method"""
-        import concurrent.futures
-
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(
-                    self.call(prompt, agent_name, max_tokens, temperature, model, max_retries, retry_delay)
-                )
-            finally:
-                try:
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    if pending:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    loop.close()
-                except Exception as e:
-                    logger.debug(f"Error cleaning up event loop: {e}")
-                finally:
-                    asyncio.set_event_loop(None)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(run_in_thread)
+        """Synchronous wrapper for async call method (runs on the shared loop with pooled connections)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.call(prompt, agent_name, max_tokens, temperature, model, max_retries, retry_delay),
+            _get_shared_loop()
+        )
+        try:
             return future.result(timeout=200)
+        except BaseException:
+            future.cancel()
+            raise
 
     def _get_agent_model(self, agent_name: str) -> Optional[str]:
         """Get model name for specific agent from config"""
@@ -321,6 +437,7 @@ class LLMService:
                 logger.error(f"API Error Response: Status {response.status}, Body: {response_text}")
 
             response.raise_for_status()
+            self._rate_limiter.on_success(response.headers)
 
             # Try to parse JSON response
             try:
@@ -486,17 +603,18 @@ async def call_llm_async(
     model: Optional[str] = None
 ) -> Tuple[str, int]:
     """
-    Async LLM call with per-agent configuration (creates new service instance per call)
+    Async LLM call with per-agent configuration
 
-    Each call creates its own service instance - fully concurrent, no global state
+    Runs on the shared LLM loop so all calls reuse one pooled HTTP session - fully concurrent
     Temperature and max_tokens default to agent-specific values from .env if not provided
     """
     agent_config = get_agent_llm_config(agent_name)
     service = LLMService(agent_config['key'], agent_config['url'])
-    try:
-        return await service.call(prompt, agent_name, max_tokens, temperature, model)
-    finally:
-        await service.close()
+    future = asyncio.run_coroutine_threadsafe(
+        service.call(prompt, agent_name, max_tokens, temperature, model),
+        _get_shared_loop()
+    )
+    return await asyncio.wrap_future(future)
 
 
 def call_llm(
@@ -507,16 +625,11 @@ def call_llm(
     model: Optional[str] = None
 ) -> Tuple[str, int]:
     """
-    Synchronous LLM call with per-agent configuration (creates new service instance per call)
+    Synchronous LLM call with per-agent configuration
 
-    Each call creates its own service instance - fully concurrent, no global state
+    Runs on the shared LLM loop so all calls reuse one pooled HTTP session - fully concurrent
     Temperature and max_tokens default to agent-specific values from .env if not provided
     """
     agent_config = get_agent_llm_config(agent_name)
     service = LLMService(agent_config['key'], agent_config['url'])
-    try:
-        return service.call_sync(prompt, agent_name, max_tokens, temperature, model)
-    finally:
-        loop = asyncio.new_event_loop()
-        loop.run_until_complete(service.close())
-        loop.close()
+    return service.call_sync(prompt, agent_name, max_tokens, temperature, model)
@@ -12,6 +12,12 @@ logger = logging.getLogger(__name__)
 
 performance_tracker = None  # Global instance for import
 
+# Fields read when formatting daily summaries; everything else stays on the server
+DAILY_SUMMARY_PROJECTION = {
+    "_id": 0, "date": 1, "tasks_completed": 1, "pull_requests_created": 1, "tokens_consumed": 1,
+    "success_count": 1, "failure_count": 1, "code_quality_scores": 1, "agent_activities": 1
+}
+
 
 class MongoPerformanceTracker:
     def __init__(self):
@@ -39,10 +45,16 @@ class MongoPerformanceTracker:
                 retryReads=True,
                 readPreference='primaryPreferred',  # Try primary, fall back to secondary
                 maxPoolSize=50,
-                minPoolSize=10
+                minPoolSize=10,
+                maxIdleTimeMS=60000  # Recycle pooled sockets idle for more than a minute
             )
             self.db = self.client[self.database_name]
             self.collection = self.db[self.collection_name]
+            try:
+                # All dashboard queries and daily upserts select on the day key
+                self.collection.create_index("date")
+            except Exception as index_error:
+                logger.warning(f"Could not create performance date index: {index_error}")
 
             # Test connection with retry
             try:
@@ -118,8 +130,8 @@ class MongoPerformanceTracker:
                 }
             }
 
-            # Fetch and sort documents
-            documents = list(self.collection.find(query).sort("date", 1))
+            # Stream only the fields used below straight off the cursor into a date-keyed map
+            date_map = {doc.get("date"): doc for doc in self.collection.find(query, DAILY_SUMMARY_PROJECTION)}
 
             # Get all unique agents
             all_agents = self.get_all_agents()
@@ -129,7 +141,6 @@ class MongoPerformanceTracker:
             # Format the REAL data for Agentic_UI consumption
             formatted_data = []
             current_date = start_date
-            date_map = {doc.get("date"): doc for doc in documents}
 
             # Ensure we have entries for all days including today
             while current_date <= today:
@@ -207,41 +218,35 @@ class MongoPerformanceTracker:
                 "agent_activities": {"$exists": True}
             }
 
-            documents = list(self.collection.find(query))
+            # Total every agent's activity server-side in a single round trip. Each day's success/failure
+            # counts are split evenly (integer division) across the agents active that day.
+            pipeline = [
+                {"$match": query},
+                {"$sort": {"date": 1}},
+                {"$project": {
+                    "_id": 0,
+                    "success_count": {"$ifNull": ["$success_count", 0]},
+                    "failure_count": {"$ifNull": ["$failure_count", 0]},
+                    "agents": {"$objectToArray": "$agent_activities"}
+                }},
+                {"$addFields": {"agent_count": {"$size": "$agents"}}},
+                {"$unwind": "$agents"},
+                {"$group": {
+                    "_id": "$agents.k",
+                    "total_tasks": {"$sum": {"$ifNull": ["$agents.v.Task_completed", 0]}},
+                    "total_tokens": {"$sum": {"$ifNull": ["$agents.v.tokens_used", 0]}},
+                    "success_count": {"$sum": {"$floor": {"$divide": ["$success_count", "$agent_count"]}}},
+                    "failure_count": {"$sum": {"$floor": {"$divide": ["$failure_count", "$agent_count"]}}},
+                    "model_used": {"$first": {"$ifNull": ["$agents.v.LLM_model_used", "unknown"]}}
+                }},
+                {"$sort": {"_id": 1}}
+            ]
+            agent_totals = {row["_id"]: row for row in self.collection.aggregate(pipeline)}
 
-            if not documents:
+            if not agent_totals:
                 logger.warning("No agent performance data found in MongoDB")
                 return []
 
-            # Aggregate agent data
-            agent_totals = {}
-
-            for doc in documents:
-                agent_activities = doc.get("agent_activities", {})
-
-                for agent_name, agent_data in agent_activities.items():
-                    if agent_name not in agent_totals:
-                        agent_totals[agent_name] = {
-                            "total_tasks": 0,
-                            "total_tokens": 0,
-                            "success_count": 0,
-                            "failure_count": 0,
-                            "model_used": agent_data.get("LLM_model_used", "unknown")
-                        }
-
-                    agent_totals[agent_name]["total_tasks"] += agent_data.get("Task_completed", 0)
-                    agent_totals[agent_name]["total_tokens"] += agent_data.get("tokens_used", 0)
-
-                # Distribute success/failure proportionally
-                doc_success = doc.get("success_count", 0)
-                doc_failure = doc.get("failure_count", 0)
-
-                total_agents = len(agent_activities)
-                if total_agents > 0:
-                    for agent_name in agent_activities.keys():
-                        agent_totals[agent_name]["success_count"] += doc_success // total_agents
-                        agent_totals[agent_name]["failure_count"] += doc_failure // total_agents
-
             # Format for Agentic_UI
             agent_data = []
             for agent_name, totals in agent_totals.items():
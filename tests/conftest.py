@@ -0,0 +1,20 @@
+"""
+Shared pytest setup
+config.settings reads several required settings at import time; default them to the
+.env.example values so modules importing the config can be tested without a .env file.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+for _name, _value in {
+    "MAX_REBUILD_ATTEMPTS": "3",
+    "REVIEW_THRESHOLD": "0.75",
+    "GOT_SCORE_THRESHOLD": "0.70",
+    "HITL_TIMEOUT_SECONDS": "300",
+    "UI_PORT": "8080",
+    "REACT_DEV_PORT": "5173",
+    "ENABLE_RECURSIVE_PROJECT_CREATION": "false",
+}.items():
+    os.environ.setdefault(_name, _value)
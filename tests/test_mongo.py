@@ -0,0 +1,61 @@
+"""Tests for the shared MongoDB helpers in workflows._mongo"""
+from datetime import datetime
+
+from bson import decode as bson_decode, encode as bson_encode
+from bson.raw_bson import RawBSONDocument
+from pymongo.errors import OperationFailure
+from pymongo.results import InsertManyResult
+
+from workflows._mongo import FEEDBACK_WRITE_CONCERN, BatchedInserter
+
+
+class UnacknowledgedCollection:
+    """Stand-in for a feedback collection bound to FEEDBACK_WRITE_CONCERN (w=0)"""
+
+    write_concern = FEEDBACK_WRITE_CONCERN
+    full_name = "test.feedback"
+
+    def __init__(self):
+        self.batches = []
+
+    def insert_many(self, documents, ordered=True, bypass_document_validation=None, **kwargs):
+        # pymongo's bulk writer rejects this combination before anything is sent
+        if bypass_document_validation and not self.write_concern.acknowledged:
+            raise OperationFailure("Cannot set bypass_document_validation with unacknowledged write concern")
+        self.batches.append(list(documents))
+        return InsertManyResult([], acknowledged=False)
+
+
+def test_flush_writes_batch_to_unacknowledged_collection():
+    collection = UnacknowledgedCollection()
+    inserter = BatchedInserter(collection, label="TEST", batch_size=10, max_age=3600)
+    documents = [{"issue_key": f"T-{i}"} for i in range(3)]
+    for document in documents:
+        inserter.add(document)
+
+    assert collection.batches == []
+    inserter.flush()
+    assert collection.batches == [documents]
+
+
+def test_full_batch_is_written_without_flush():
+    collection = UnacknowledgedCollection()
+    inserter = BatchedInserter(collection, label="TEST", batch_size=2, max_age=3600)
+    inserter.add({"issue_key": "T-1"})
+    inserter.add({"issue_key": "T-2"})
+
+    assert collection.batches == [[{"issue_key": "T-1"}, {"issue_key": "T-2"}]]
+
+
+def test_planner_raw_bson_batch_is_written():
+    # JiraPlannerWorkflow._store_to_mongodb buffers pre-encoded documents on a w=0 collection
+    collection = UnacknowledgedCollection()
+    inserter = BatchedInserter(collection, label="JIRA-PLANNER", batch_size=10, max_age=3600)
+    now = datetime.now().replace(microsecond=0)
+    document = {"agent_type": "planner", "issue_key": "T-1", "timestamp": now, "subtasks": [{"id": 1}]}
+    inserter.add(RawBSONDocument(bson_encode(document)))
+    inserter.flush()
+
+    assert len(collection.batches) == 1
+    (written,) = collection.batches[0]
+    assert bson_decode(written.raw) == document
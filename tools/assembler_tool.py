@@ -215,7 +215,7 @@ def generate_deployment_document(
             local_folder = "deployment_documents"
             os.makedirs(local_folder, exist_ok=True)
             md_path = os.path.join(local_folder, f"{issue_data.get('key', 'UNKNOWN')}.md")
-            with open(md_path, 'w', encoding='utf-8') as f:
+            with open(md_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(md_content)
             logger.info(f"[{thread_id}] ✓ Deployment document saved to {md_path}")
         else:
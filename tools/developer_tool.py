@@ -21,6 +21,9 @@ from services.llm_service import call_llm
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for saved project files so each file is flushed in a single write syscall
+FILE_WRITE_BUFFER = 1 << 20
+
 # Shared resources
 stats_lock = Lock()
 tool_stats = {
@@ -69,7 +72,7 @@ def save_files_locally(files: Dict[str, str], issue_key: str):
     for filename, content in files.items():
         path = os.path.join(project_folder, filename)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
+        with open(path, 'w', encoding='utf-8', buffering=FILE_WRITE_BUFFER) as f:
             f.write(content)
         logging.info(f"Saved {filename} to {path}")
 
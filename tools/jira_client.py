@@ -3,13 +3,16 @@ MCP JIRA Client Tool
 - Implements get_project_issues_mcp_tool for fetching complete JIRA issues
 - Added get_todo_issues_mcp_tool for fetching only "To Do" issues
 - Added get_jira_client for creating JIRA instance
+- Added create_jira_issues_mcp_tool for bulk issue creation
+- Added get_jira_project_keys (TTL-cached) for project existence checks
 - Uses project key from .env/config
 - Fetches issues with compatible parsed format
 - Thread-safe logging
 """
 
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Set
 from datetime import datetime
 from threading import Lock
 from jira import JIRA, JIRAError
@@ -27,6 +30,15 @@ logger = logging.getLogger(__name__)
 # Thread-safe lock for JIRA operations
 jira_lock = Lock()
 
+# JIRA accepts at most this many issues per /issue/bulk request
+JIRA_BULK_CREATE_LIMIT = 50
+
+# Short-lived cache of existing project keys (see get_jira_project_keys)
+PROJECT_KEYS_TTL_SECONDS = 60
+_project_keys = None
+_project_keys_fetched_at = 0.0
+project_keys_lock = Lock()
+
 # Statistics tracking
 mcp_stats = {
     'fetches': 0,
@@ -108,6 +120,30 @@ def get_jira_client() -> JIRA:
     )
 
 
+def get_jira_project_keys() -> Set[str]:
+    """
+    Return the keys of all JIRA projects visible to the configured user.
+    The list is fetched with one projects() call and cached for PROJECT_KEYS_TTL_SECONDS.
+    """
+    global _project_keys, _project_keys_fetched_at
+    with project_keys_lock:
+        if _project_keys is not None and time.monotonic() - _project_keys_fetched_at < PROJECT_KEYS_TTL_SECONDS:
+            return _project_keys
+    keys = {p.key for p in get_jira_client().projects()}
+    with project_keys_lock:
+        _project_keys = keys
+        _project_keys_fetched_at = time.monotonic()
+    return keys
+
+
+def _remember_project_key(project_key: str) -> None:
+    """Add a newly created project to the cached key set (if one is cached)"""
+    global _project_keys
+    with project_keys_lock:
+        if _project_keys is not None:
+            _project_keys = _project_keys | {project_key}
+
+
 def get_project_issues_mcp_tool(thread_id: str) -> Dict[str, Any]:
     """
     Fetch ALL issues from the configured JIRA project for design document.
@@ -433,6 +469,7 @@ def create_jira_project_mcp_tool(project_name: str, project_key: str, descriptio
                 project_key_returned = result.get('key')
 
                 logger.info(f"{log_prefix} Successfully created project {project_key_returned}: {project_id}")
+                _remember_project_key(project_key_returned.upper())
 
                 return {
                     'success': True,
@@ -511,6 +548,83 @@ def create_jira_issue_mcp_tool(project_key: str, summary: str, description: str,
         }
 
 
+def create_jira_issues_mcp_tool(project_key: str, issues: List[Dict[str, str]],
+                                thread_id: str = "unknown") -> List[Dict[str, Any]]:
+    """
+    Create several JIRA issues in one request via the bulk endpoint (/rest/api/2/issue/bulk).
+
+    Args:
+        project_key: Project key where the issues should be created
+        issues: List of {"summary", "description", "issue_type"} dicts (issue_type defaults to Task)
+        thread_id: Thread identifier for logging
+
+    Returns:
+        One result per input issue, in input order, shaped like create_jira_issue_mcp_tool's
+        ('success', 'issue_key', 'issue_id' or 'error'). Entries are None for issues whose bulk
+        request was rejected as a whole, so callers can retry just those one by one.
+    """
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    log_prefix = f"[{timestamp}] [MCP-JIRA-BULK-CREATE] [{thread_id}]"
+
+    results: List[Dict[str, Any]] = []
+    with jira_lock:
+        jira = get_jira_client()
+        url = f"{jira._options['server']}/rest/api/2/issue/bulk"
+
+        for start in range(0, len(issues), JIRA_BULK_CREATE_LIMIT):
+            chunk = issues[start:start + JIRA_BULK_CREATE_LIMIT]
+            logger.info(f"{log_prefix} Creating {len(chunk)} issues in {project_key}")
+            try:
+                response = jira._session.post(url, json={"issueUpdates": [
+                    {"fields": {
+                        "project": {"key": project_key},
+                        "summary": item["summary"],
+                        "description": item["description"],
+                        "issuetype": {"name": item.get("issue_type", "Task")}
+                    }}
+                    for item in chunk
+                ]})
+                if response.status_code not in (200, 201):
+                    raise JIRAError(status_code=response.status_code, text=response.text)
+                body = response.json()
+            except Exception as e:
+                logger.warning(f"{log_prefix} Bulk request rejected: {str(e)}")
+                results.extend([None] * len(chunk))
+                continue
+
+            failed = {err.get("failedElementNumber"): err for err in body.get("errors", [])}
+            created = iter(body.get("issues", []))
+            created_at = datetime.now().isoformat()
+            for i in range(len(chunk)):
+                if i in failed:
+                    error_msg = f"Failed to create JIRA issue: {failed[i].get('elementErrors')}"
+                    logger.error(f"{log_prefix} {error_msg}")
+                    results.append({'success': False, 'error': error_msg})
+                    continue
+                new_issue = next(created, None)
+                if new_issue is None:
+                    # JIRA reported fewer issues than it accepted - record a failure rather than
+                    # None, since a retry could duplicate an issue that was created but not listed
+                    error_msg = f"Bulk response listed no created issue for element {start + i}"
+                    logger.error(f"{log_prefix} {error_msg}")
+                    results.append({'success': False, 'error': error_msg})
+                    continue
+                results.append({
+                    'success': True,
+                    'issue_key': new_issue.get('key'),
+                    'issue_id': new_issue.get('id'),
+                    'project_key': project_key,
+                    'created_at': created_at
+                })
+
+    attempted = sum(1 for r in results if r is not None)
+    created_count = sum(1 for r in results if r is not None and r['success'])
+    update_mcp_stats('issue_creations', attempted)
+    update_mcp_stats('errors', attempted - created_count)
+    logger.info(f"{log_prefix} Created {created_count}/{len(issues)} issues in {project_key}")
+    return results
+
+
 def get_mcp_stats() -> Dict[str, Any]:
     """Get MCP JIRA tool statistics"""
     with stats_lock:
@@ -534,7 +648,8 @@ def get_mcp_stats() -> Dict[str, Any]:
                 "statistics_tracking",
                 "error_handling",
                 "project_creation",
-                "issue_creation"
+                "issue_creation",
+                "bulk_issue_creation"
             ]
         }
 
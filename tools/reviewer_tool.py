@@ -5,8 +5,12 @@ Simplified Reviewer Tools - Reduced Code with Full Functionality
 import os
 import json
 import logging
+import functools
+import hashlib
+import orjson
+from collections import Counter
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from threading import Lock
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
@@ -30,6 +34,7 @@ logger = logging.getLogger(__name__)
 # Shared resources and locks
 stats_lock = Lock()
 mongodb_lock = Lock()
+score_cache_lock = Lock()
 
 # Global configuration (initialized once)
 config = None
@@ -37,8 +42,25 @@ prompt_loader = PromptLoader("prompts")
 llm_instance = None
 mongo_client = None
 mongo_collection = None
+score_cache_collection = None
 knowledge_base = {}
 
+# Content-addressed cache of LLM pylint scores, keyed by a hash of the rendered prompt
+SCORE_CACHE_TTL_SECONDS = 7 * 86400
+SCORE_CACHE_MAX_ENTRIES = 1024
+score_cache = {}
+
+# Unwanted cosmetic Pylint issues to filter (not critical for code quality)
+PYLINT_COSMETIC_SYMBOLS = frozenset({
+    "missing-final-newline",
+    "trailing-whitespace",
+    "line-too-long",
+    "missing-module-docstring",  # Optional: can be removed if docstrings are important
+    "missing-class-docstring",   # Optional: can be removed if docstrings are important
+    "missing-function-docstring" # Optional: can be removed if docstrings are important
+})
+PYLINT_COSMETIC_IDS = frozenset({"C0304", "C0303", "C0301"})  # Corresponding message IDs
+
 # Statistics tracking
 tool_stats = {
     'knowledge_base_calls': 0, 'completeness_analyses': 0, 'security_analyses': 0,
@@ -53,6 +75,7 @@ class ReviewResult(BaseModel):
     score: float = Field(description="Review score from 0-100", ge=0, le=100)
     mistakes: List[str] = Field(description="List of identified issues and improvement suggestions")
     reasoning: str = Field(description="Explanation for the score", default="")
+    parsed: bool = Field(description="False when the LLM reply could not be parsed and fallback values were used", default=True)
 
 
 class ComprehensiveReviewResult(BaseModel):
@@ -118,7 +141,7 @@ def _load_knowledge_base():
 
 def _initialize_mongodb():
     """Initialize MongoDB connection once at startup"""
-    global mongo_client, mongo_collection
+    global mongo_client, mongo_collection, score_cache_collection
 
     try:
         connection_string = config.MONGODB_CONNECTION_STRING
@@ -157,12 +180,68 @@ def _initialize_mongodb():
         except Exception as e:
             logger.warning(f"Could not create MongoDB indexes: {e}")
 
+        try:
+            score_cache_collection = mongo_db[getattr(config, 'MONGODB_SCORE_CACHE_COLLECTION', 'pylint_score_cache')]
+            score_cache_collection.create_index("created_at", expireAfterSeconds=SCORE_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Could not initialize score cache collection: {e}")
+            score_cache_collection = None
+
         logger.info(f"MongoDB ready - Database: {database_name}, Collection: {collection_name}")
     except Exception as e:
         logger.error(f"MongoDB initialization failed: {e}")
         logger.info("Continuing without MongoDB - reviews will not be persisted")
         mongo_client = None
         mongo_collection = None
+        score_cache_collection = None
+
+
+def _get_cached_score(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached LLM score in memory, then in the shared MongoDB cache"""
+    with score_cache_lock:
+        hit = score_cache.get(cache_key)
+    if hit is not None or score_cache_collection is None:
+        return hit
+
+    try:
+        doc = score_cache_collection.find_one({"_id": cache_key}, {"score": 1, "reasoning": 1})
+    except PyMongoError as e:
+        logger.debug(f"Score cache lookup failed: {e}")
+        return None
+    if doc is None:
+        return None
+
+    hit = {"score": doc["score"], "reasoning": doc.get("reasoning", "")}
+    with score_cache_lock:
+        score_cache[cache_key] = hit
+    return hit
+
+
+def _store_cached_score(cache_key: str, score: float, reasoning: str):
+    """Store an LLM score in memory (bounded, oldest evicted first) and in the shared MongoDB cache"""
+    entry = {"score": score, "reasoning": reasoning}
+    with score_cache_lock:
+        if len(score_cache) >= SCORE_CACHE_MAX_ENTRIES:
+            score_cache.pop(next(iter(score_cache)))
+        score_cache[cache_key] = entry
+
+    if score_cache_collection is None:
+        return
+    try:
+        score_cache_collection.update_one(
+            {"_id": cache_key},
+            {"$set": {**entry, "created_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+    except PyMongoError as e:
+        logger.debug(f"Score cache store failed: {e}")
+
+
+def _ascii_only(text: str) -> str:
+    """Strip non-ASCII characters, skipping the encode/decode round-trip for plain ASCII text"""
+    if text.isascii():
+        return text
+    return text.encode('ascii', 'ignore').decode('ascii')
 
 
 def parse_llm_result(content: str, review_type: str) -> ReviewResult:
@@ -227,7 +306,8 @@ def parse_llm_result(content: str, review_type: str) -> ReviewResult:
         return ReviewResult(
             score=75.0,
             mistakes=[f"Could not parse {review_type} review - please check manually"],
-            reasoning=f"Automated {review_type} review incomplete"
+            reasoning=f"Automated {review_type} review incomplete",
+            parsed=False
         )
 
     except Exception as e:
@@ -235,7 +315,8 @@ def parse_llm_result(content: str, review_type: str) -> ReviewResult:
         return ReviewResult(
             score=70.0,
             mistakes=[f"Error in {review_type} review: {str(e)}"],
-            reasoning="Review encountered an error"
+            reasoning="Review encountered an error",
+            parsed=False
         )
 
 
@@ -652,10 +733,8 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
         import subprocess
         import tempfile
         import os
-        import json
-        from io import StringIO
         from pylint.lint import Run
-        from pylint.reporters import JSONReporter
+        from pylint.reporters import CollectingReporter
 
         with stats_lock:
             tool_stats['pylint_analyses'] += 1
@@ -663,9 +742,12 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
         logger.info(f"[{thread_id}] Running Pylint analysis on Python files with LLM scoring")
 
         pylint_results = {}
-        all_issues = []
-        all_issues_json = []
+        filtered_issues_json = []
+        filtered_issues_display = []
+        total_issue_count = 0
+        type_totals = Counter()
         total_files = 0
+        linted_files = 0
 
         for filename, content in files_content.items():
             # Only analyze Python files
@@ -680,9 +762,8 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
                 temp_path = temp_file.name
 
             try:
-                # Capture Pylint output
-                pylint_output = StringIO()
-                reporter = JSONReporter(pylint_output)
+                # Collect Pylint messages in memory (no JSON encode/decode round-trip)
+                reporter = CollectingReporter()
 
                 # Run Pylint with UTF-8 encoding environment
                 import sys
@@ -696,8 +777,6 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
                 try:
                     pylint_args = [
                         temp_path,
-                        '--output-format=json',
-                        '--reports=yes',
                         '--score=yes'
                     ]
 
@@ -710,41 +789,45 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
                     sys.stdout = old_stdout
                     sys.stderr = old_stderr
 
-                # Parse results
-                pylint_output.seek(0)
-                output_content = pylint_output.getvalue()
-                issues = json.loads(output_content) if output_content.strip() else []
+                issues = reporter.messages
+                linted_files += 1
 
-                # Count issues by type
-                error_count = len([msg for msg in issues if msg['type'] == 'error'])
-                warning_count = len([msg for msg in issues if msg['type'] == 'warning'])
-                convention_count = len([msg for msg in issues if msg['type'] == 'convention'])
-                refactor_count = len([msg for msg in issues if msg['type'] == 'refactor'])
+                # Count issues by type in a single pass
+                type_counts = Counter(msg.category for msg in issues)
+                type_totals.update(type_counts)
+                error_count = type_counts['error']
+                warning_count = type_counts['warning']
+                convention_count = type_counts['convention']
+                refactor_count = type_counts['refactor']
 
-                # Collect all issues with proper structure - sanitize strings to avoid encoding issues
+                # Single pass: format every issue for display, but only materialize the
+                # structured record for significant (non-cosmetic) issues
+                file_issues = []
+                total_issue_count += len(issues)
                 for issue in issues:
                     # Sanitize message text to remove problematic Unicode characters
-                    message = issue.get('message', '').encode('ascii', 'ignore').decode('ascii')
-                    symbol = issue.get('symbol', '').encode('ascii', 'ignore').decode('ascii')
+                    message = _ascii_only(issue.msg or '')
+                    symbol = _ascii_only(issue.symbol or '')
+                    line = issue.line or 0
+                    issue_type = issue.category or 'unknown'
+                    message_id = issue.msg_id or ''
+
+                    formatted_issue = f"Line {line}: [{issue_type.upper()}] {message} ({symbol})"
+                    file_issues.append(formatted_issue)
+
+                    if symbol in PYLINT_COSMETIC_SYMBOLS or message_id in PYLINT_COSMETIC_IDS:
+                        continue
 
-                    all_issues_json.append({
+                    filtered_issues_json.append({
                         "file": filename,
-                        "line": issue.get('line', 0),
-                        "column": issue.get('column', 0),
-                        "type": issue.get('type', 'unknown'),
+                        "line": line,
+                        "column": issue.column or 0,
+                        "type": issue_type,
                         "message": message,
                         "symbol": symbol,
-                        "message_id": issue.get('message-id', '')
+                        "message_id": message_id
                     })
-
-                # Format issues for display
-                file_issues = []
-                for issue in issues:
-                    # Sanitize display text as well
-                    msg = issue.get('message', '').encode('ascii', 'ignore').decode('ascii')
-                    sym = issue.get('symbol', '').encode('ascii', 'ignore').decode('ascii')
-                    formatted_issue = f"Line {issue.get('line', 0)}: [{issue.get('type', 'unknown').upper()}] {msg} ({sym})"
-                    file_issues.append(formatted_issue)
+                    filtered_issues_display.append(f"{filename} - {formatted_issue}")
 
                 pylint_results[filename] = {
                     'errors': error_count,
@@ -777,32 +860,8 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
                 if os.path.exists(temp_path):
                     os.unlink(temp_path)
 
-        # Define unwanted cosmetic issues to filter (not critical for code quality)
-        unwanted_symbols = {
-            "missing-final-newline",
-            "trailing-whitespace",
-            "line-too-long",
-            "missing-module-docstring",  # Optional: can be removed if docstrings are important
-            "missing-class-docstring",   # Optional: can be removed if docstrings are important
-            "missing-function-docstring" # Optional: can be removed if docstrings are important
-        }
-        unwanted_ids = {"C0304", "C0303", "C0301"}  # Corresponding message IDs
-
-        # Filter out cosmetic issues
-        filtered_issues_json = [
-            issue for issue in all_issues_json
-            if issue["symbol"] not in unwanted_symbols and issue["message_id"] not in unwanted_ids
-        ]
-
-        # Format filtered issues for display
-        filtered_issues_display = [
-            f"{issue['file']} - Line {issue['line']}: [{issue['type'].upper()}] {issue['message']} ({issue['symbol']})"
-            for issue in filtered_issues_json
-        ]
-
-        logger.info(f"[{thread_id}] Pylint issues: {len(filtered_issues_json)} significant (filtered {len(all_issues_json) - len(filtered_issues_json)} cosmetic issues)")
+        logger.info(f"[{thread_id}] Pylint issues: {len(filtered_issues_json)} significant (filtered {total_issue_count - len(filtered_issues_json)} cosmetic issues)")
 
-        # Always use LLM for scoring (even with 0 issues for consistency)
         if total_files == 0:
             return {
                 "success": True,
@@ -815,22 +874,47 @@ def analyze_python_code_with_pylint(files_content: Dict[str, str], thread_id: st
                 "tokens_used": 0
             }
 
+        # Pylint raised for every file - there is no analysis to score, so don't report a clean run
+        if linted_files == 0:
+            logger.warning(f"[{thread_id}] Pylint could not analyze any of {total_files} Python files")
+            return {
+                "success": False,
+                "error": f"Pylint analysis failed for all {total_files} Python files",
+                "file_results": pylint_results,
+                "files_analyzed": 0,
+                "tokens_used": 0
+            }
+
+        # Clean run - nothing for the LLM to weigh, skip the scoring call entirely
+        if not filtered_issues_json:
+            logger.info(f"[{thread_id}] No significant Pylint issues - skipping LLM scoring (100/100)")
+            return {
+                "success": True,
+                "score": 100.0,
+                "pylint_score": 10.0,
+                "mistakes": ["No significant issues found - good code quality!"],
+                "reasoning": "No significant pylint issues detected.",
+                "file_results": pylint_results,
+                "files_analyzed": total_files,
+                "total_issues": total_issue_count,
+                "significant_issues": 0,
+                "filtered_issues": total_issue_count,
+                "tokens_used": 0
+            }
+
         # Prepare summary for LLM
-        total_errors = sum(r.get('errors', 0) for r in pylint_results.values())
-        total_warnings = sum(r.get('warnings', 0) for r in pylint_results.values())
-        total_conventions = sum(r.get('conventions', 0) for r in pylint_results.values())
-        total_refactors = sum(r.get('refactors', 0) for r in pylint_results.values())
-
-        # Prepare detailed issues for LLM (if any significant issues exist)
-        if len(filtered_issues_json) > 0:
-            issues_json_str = json.dumps(filtered_issues_json, indent=2)
-        else:
-            issues_json_str = "[]"
+        total_errors = type_totals['error']
+        total_warnings = type_totals['warning']
+        total_conventions = type_totals['convention']
+        total_refactors = type_totals['refactor']
+
+        # Prepare detailed issues for LLM
+        issues_json_str = orjson.dumps(filtered_issues_json, option=orjson.OPT_INDENT_2).decode()
 
         # Build comprehensive context for LLM scoring
         pylint_context = f"""
 Files Analyzed: {total_files}
-Total Issues Found: {len(all_issues_json)}
+Total Issues Found: {total_issue_count}
 Issues After Filtering: {len(filtered_issues_json)}
 
 Issue Breakdown:
@@ -839,7 +923,7 @@ Issue Breakdown:
 - Conventions: {total_conventions}
 - Refactors: {total_refactors}
 
-Filtered out cosmetic issues: {len(all_issues_json) - len(filtered_issues_json)} (line-too-long, trailing-whitespace, missing-final-newline)
+Filtered out cosmetic issues: {total_issue_count - len(filtered_issues_json)} (line-too-long, trailing-whitespace, missing-final-newline)
 
 Significant Issues Details:
 {issues_json_str}
@@ -858,16 +942,29 @@ Significant Issues Details:
             issues_json=issues_json_str
         )
 
-        content, tokens = call_llm(pylint_prompt, agent_name="reviewer")
+        # Identical prompts (e.g. CI re-runs on the same commit) reuse the cached score
+        cache_key = hashlib.blake2b(pylint_prompt.encode('utf-8'), digest_size=16).hexdigest()
+        cached = _get_cached_score(cache_key)
 
-        logger.info(f"[{thread_id}] LLM returned {len(content)} characters for Pylint scoring")
-        logger.debug(f"[{thread_id}] LLM response preview: {content[:200]}")
+        if cached is not None:
+            final_score = cached["score"]
+            reasoning = cached["reasoning"]
+            tokens = 0
+            logger.info(f"[{thread_id}] Pylint score cache hit - skipping LLM scoring")
+        else:
+            content, tokens = call_llm(pylint_prompt, agent_name="reviewer")
+
+            logger.info(f"[{thread_id}] LLM returned {len(content)} characters for Pylint scoring")
+            logger.debug(f"[{thread_id}] LLM response preview: {content[:200]}")
 
-        # Parse LLM result
-        parsed_result = parse_llm_result(content, "pylint")
+            # Parse LLM result
+            parsed_result = parse_llm_result(content, "pylint")
 
-        final_score = parsed_result.score
-        reasoning = parsed_result.reasoning
+            final_score = parsed_result.score
+            reasoning = parsed_result.reasoning
+            # Fallback scores stand in for an unparseable reply - never cache them for identical code
+            if parsed_result.parsed:
+                _store_cached_score(cache_key, final_score, reasoning)
 
         logger.info(f"[{thread_id}] LLM-based Pylint score: {final_score}/100 ({len(filtered_issues_json)} significant issues)")
 
@@ -879,9 +976,9 @@ Significant Issues Details:
             "reasoning": reasoning,
             "file_results": pylint_results,
             "files_analyzed": total_files,
-            "total_issues": len(all_issues_json),
+            "total_issues": total_issue_count,
             "significant_issues": len(filtered_issues_json),
-            "filtered_issues": len(all_issues_json) - len(filtered_issues_json),
+            "filtered_issues": total_issue_count - len(filtered_issues_json),
             "tokens_used": tokens
         }
 
@@ -892,9 +989,11 @@ Significant Issues Details:
         return {"success": False, "error": str(e), "tokens_used": 0}
 
 
+@functools.cache
 def get_reviewer_tools():
-    """Get all reviewer tools as a list for LangGraph integration"""
-    return [
+    """Get all reviewer tools for LangGraph integration (built once, returned as an immutable tuple;
+    wrap in list(...) at the call site if a mutable list is required)"""
+    return (
         get_knowledge_base_content,
         analyze_code_completeness,
         analyze_code_security,
@@ -903,7 +1002,7 @@ def get_reviewer_tools():
         store_review_in_mongodb,
         format_files_for_review,
         analyze_python_code_with_pylint  # NEW TOOL
-    ]
+    )
 
 
 def get_reviewer_tools_stats() -> Dict[str, Any]:
@@ -11,27 +11,23 @@ This module handles all Agentic_UI connections and HTTP server operations, while
 """
 # ui.py
 import os
-import json
+import importlib
 import logging
 import threading
 import time
 from datetime import datetime
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import parse_qs, urlparse
-from typing import Dict, List, Any
-from pymongo import MongoClient
+from typing import Dict, List, Any, Callable, Tuple
 
 # Import config from settings
 from config.settings import config
 
-# Performance tracking import
-from services.performance_tracker import MongoPerformanceTracker
+import orjson
 
 # HTTP Server imports for React Agentic_UI integration
-import socketserver
-
-# Import the router for core functionality
-import core.router
+import socket
+from concurrent.futures import ThreadPoolExecutor
 
 # Global workflow status tracking
 workflow_status = {"agent": None}
@@ -47,9 +43,261 @@ logger = logging.getLogger(__name__)
 # Agentic_UI Server components
 ui_server = None
 ui_server_thread = None
+# Guards rebinding of the server globals above. Shared state in this module is protected by explicit
+# locks rather than relying on GIL-atomic dict/attribute ops, so it stays race-free on free-threaded
+# builds (PEP 703); each cache below carries its own lock for its read-modify-write sections.
+_globals_lock = threading.Lock()
+# Worker threads serving UI connections. Keep-alive connections hold a worker until they go idle
+# (ReactUIHandler.timeout), so leave headroom for several browser tabs' worth of connections.
+UI_SERVER_WORKERS = max(32, (os.cpu_count() or 4) * 2)
+
+# Shared performance tracker and router module, bound lazily so importing this module does no Mongo
+# or router work (see _ensure_tracker and _router)
+performance_tracker = None
+_router_module = None
+
+# Parsed .env contents cached between config saves (re-read when the file mtime changes)
+ENV_FILE_PATH = '.env'
+_env_cache: Dict[str, str] = None
+_env_mtime = None
+_env_lock = threading.Lock()
+
+# Prebuilt response header blocks (status line and Content-Length are added per response)
+_CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type, Authorization\r\n"
+    b"Access-Control-Max-Age: 3600\r\n"
+)
+_CORS_AND_JSON = _CORS_HEADERS + b"Content-Type: application/json\r\n"
+
+# Short-TTL cache of encoded responses for endpoints the React UI polls continuously
+# (path -> (monotonic timestamp, JSON bytes)) so bursts of polls collapse to one compute
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+_response_cache_lock = threading.Lock()
+STATUS_CACHE_TTL = 0.25
+HEALTH_CACHE_TTL = 1.0
+
+# Last MongoDB ping result, shared by all health checks within MONGO_HEALTH_TTL
+MONGO_HEALTH_TTL = 5.0
+_mongo_health = {"ts": float("-inf"), "ok": False}
+_mongo_health_lock = threading.Lock()
+
+# Approximate "timestamp" fields on polled endpoints share one formatted value per 10ms window
+NOW_ISO_RESOLUTION = 0.01
+_now_iso_cache: Tuple[float, str] = (float("-inf"), "")
+
+# Background refresh of the performance endpoint bodies while the UI is polling them
+PERF_REFRESH_INTERVAL = 2.0
+PERF_IDLE_AFTER = 30.0
+
+# Static agent entries reported before the router is up (lastActivity is stamped per request)
+_DEFAULT_AGENT_SKELETON = tuple(
+    {"id": agent_id, "name": name, "status": "active", "tasksProcessed": 0, "tokensConsumed": 0}
+    for agent_id, name in (
+        ("PlannerAgent", "Planner"),
+        ("AssemblerAgent", "Assembler"),
+        ("DeveloperAgent", "Developer"),
+        ("ReviewerAgent", "Reviewer"),
+    )
+)
+
+
+def _router():
+    """Return the core.router module, importing it on first use"""
+    global _router_module
+    if _router_module is None:
+        _router_module = importlib.import_module("core.router")
+    return _router_module
+
+
+def _ensure_tracker():
+    """Bind the process-wide MongoPerformanceTracker on first use (its import opens the Mongo connection)"""
+    global performance_tracker
+    with _globals_lock:
+        if performance_tracker is None:
+            try:
+                from services.performance_tracker import performance_tracker as shared_tracker
+                performance_tracker = shared_tracker
+            except Exception as e:
+                logger.error(f"Performance tracker unavailable: {e}")
+        return performance_tracker
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes"""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(data, option=option)
 
-# Initialize performance tracker globally
-performance_tracker = MongoPerformanceTracker()
+
+def _json_loads(data) -> Any:
+    """Parse a JSON request body from bytes"""
+    return orjson.loads(data)
+
+
+# Per-thread reusable buffer for POST bodies (grown on demand past POST_BUFFER_SIZE)
+POST_BUFFER_SIZE = 64 * 1024
+_tls = threading.local()
+
+# Pre-encoded bodies for the fixed error replies
+_ERR_NO_DATA = _json_dumps({"success": False, "error": "No data provided"})
+_ERR_NOT_FOUND = _json_dumps({"error": "Endpoint not found"})
+_ERR_NO_UPDATES = _json_dumps({"success": False, "error": "No updates provided"})
+_ERR_NO_CONFIG = _json_dumps({"success": False, "error": "No configuration provided"})
+
+
+def _cached_response(path: str, ttl: float, producer: Callable[[], Any], indent: bool = False) -> bytes:
+    """ Return the cached JSON bytes for path if younger than ttl, otherwise rebuild them.
+    Args:
+        path: Cache key (the request path)
+        ttl: Maximum age in seconds of a cached response
+        producer: Callable returning the response data on a cache miss
+        indent: Whether to pretty-print the JSON
+    Returns:
+        Encoded JSON response body
+    """
+    now = time.monotonic()
+    with _response_cache_lock:
+        hit = _response_cache.get(path)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    body = _json_dumps(producer(), indent=indent)
+    with _response_cache_lock:
+        _response_cache[path] = (now, body)
+    return body
+
+
+def _approx_now_iso() -> str:
+    """Return datetime.now().isoformat(), reusing the previous value for up to NOW_ISO_RESOLUTION seconds"""
+    global _now_iso_cache
+    stamped_at, value = _now_iso_cache
+    now = time.monotonic()
+    if now - stamped_at >= NOW_ISO_RESOLUTION:
+        value = datetime.now().isoformat()
+        # Single tuple rebind: racing threads at worst both format and one value wins, never a torn pair
+        _now_iso_cache = (now, value)
+    return value
+
+
+def _now_strings() -> Tuple[str, str]:
+    """Return the current time as (ISO timestamp, 12-hour clock string) from a single clock read"""
+    now = datetime.now()
+    return now.isoformat(), now.strftime("%I:%M:%S %p")
+
+
+def _default_agents(now_str: str) -> List[Dict[str, Any]]:
+    """Build the default agent stats list, stamped with now_str as lastActivity"""
+    return [{**agent, "lastActivity": now_str} for agent in _DEFAULT_AGENT_SKELETON]
+
+
+def _perf_last_7_days() -> Dict[str, Any]:
+    """Build the last-7-days performance payload (served by both performance-data and weekly)"""
+    return {
+        "success": True,
+        "performance_data": performance_tracker.get_last_7_days_data(),
+        "timestamp": _approx_now_iso()
+    }
+
+
+def _perf_realtime() -> Dict[str, Any]:
+    """Build the real-time metrics payload"""
+    return {
+        "success": True,
+        "data": performance_tracker.get_real_time_metrics(),
+        "timestamp": _approx_now_iso()
+    }
+
+
+def _perf_agents() -> Dict[str, Any]:
+    """Build the agent performance payload"""
+    return {
+        "success": True,
+        "agent_performance": performance_tracker.get_agent_performance_data(),
+        "timestamp": _approx_now_iso()
+    }
+
+
+class _PerfSnapshot:
+    """Pre-encoded performance endpoint bodies, refreshed by a background thread while the UI is polling"""
+
+    PRODUCERS = {
+        "last7": _perf_last_7_days,
+        "realtime": _perf_realtime,
+        "agents": _perf_agents,
+    }
+
+    def __init__(self):
+        self._bodies: Dict[str, bytes] = {}
+        self._last_read = float("-inf")
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def get(self, name: str) -> bytes:
+        """Return the latest encoded body for name, computing it inline on a cold cache"""
+        with self._lock:
+            self._last_read = time.monotonic()
+            body = self._bodies.get(name)
+        if body is None:
+            body = self.refresh(name)
+        return body
+
+    def refresh(self, name: str) -> bytes:
+        """Recompute and swap in the encoded body for name"""
+        body = _json_dumps(self.PRODUCERS[name]())
+        with self._lock:
+            self._bodies[name] = body
+        return body
+
+    def _run(self):
+        while not self._stop_event.wait(PERF_REFRESH_INTERVAL):
+            with self._lock:
+                idle = time.monotonic() - self._last_read > PERF_IDLE_AFTER
+            # Skip Mongo aggregations entirely when nobody has polled recently
+            if idle:
+                continue
+            for name in self.PRODUCERS:
+                try:
+                    self.refresh(name)
+                except Exception as e:
+                    logger.warning(f"Performance snapshot refresh failed for {name}: {e}")
+
+    def start(self):
+        """Start the background refresher thread"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="PerfSnapshotRefresher")
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background refresher thread"""
+        with self._lock:
+            self._stop_event.set()
+            self._thread = None
+
+
+_perf_snapshot = _PerfSnapshot()
+
+
+def _workflow_status_snapshot() -> Dict[str, Any]:
+    """Copy the shared workflow status under its lock"""
+    with workflow_status_lock:
+        return workflow_status.copy()
+
+
+def _read_env_file(env_path: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from an env file (missing file yields an empty mapping)"""
+    env_vars = {}
+    if os.path.exists(env_path):
+        with open(env_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    env_vars[key] = value
+    return env_vars
 
 
 def update_env_file(updates: Dict[str, str]) -> bool:
@@ -59,29 +307,28 @@ def update_env_file(updates: Dict[str, str]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    global _env_cache, _env_mtime
     try:
-        from dotenv import load_dotenv
-
-        env_path = '.env'
-        env_vars = {}
-        # Read existing .env file if it exists
-        if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key] = value
-        # Update with new values
-        env_vars.update(updates)
-        # Write back to .env file
-        with open(env_path, 'w') as f:
-            for key, value in env_vars.items():
-                f.write(f"{key}={value}\n")
-        # Reload environment variables
-        load_dotenv(override=True)
-        # Update config object with new values
-        for key, value in updates.items():
+        env_path = ENV_FILE_PATH
+        with _env_lock:
+            # Parse the file only on first use or when it was edited outside the UI
+            mtime = os.path.getmtime(env_path) if os.path.exists(env_path) else None
+            if _env_cache is None or mtime != _env_mtime:
+                _env_cache = _read_env_file(env_path)
+            changed = {key: value for key, value in updates.items() if _env_cache.get(key) != value}
+            if not changed:
+                _env_mtime = mtime
+                return True
+            _env_cache.update(changed)
+            # Write to a temp file and swap it in so readers never see a partial .env
+            tmp_path = f"{env_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.writelines(f"{key}={value}\n" for key, value in _env_cache.items())
+            os.replace(tmp_path, env_path)
+            _env_mtime = os.path.getmtime(env_path)
+        # Apply only the changed values to the process environment and config object
+        os.environ.update({key: str(value) for key, value in changed.items()})
+        for key, value in changed.items():
             if hasattr(config, key):
                 setattr(config, key, value)
         return True
@@ -106,65 +353,63 @@ def get_env_config(keys: List[str]) -> Dict[str, str]:
 class ReactUIHandler(BaseHTTPRequestHandler):
     """HTTP handler for React Agentic_UI communication with MongoDB performance tracking"""
 
+    # Persistent connections so polling clients reuse one TCP connection (every reply sets Content-Length)
+    protocol_version = "HTTP/1.1"
+
+    # Socket timeout so idle or stalled clients cannot pin a server thread indefinitely
+    timeout = 30
+
+    def setup(self):
+        """Disable Nagle on the accepted socket so small JSON replies are sent immediately"""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def log_message(self, format, *args):
         """Suppress default HTTP request logging"""
         pass
 
+    # Path -> handler method name, resolved once per request with a single dict lookup
+    _GET_ROUTES = {
+        '/api/workflow_status': 'handle_workflow_status_request',
+        '/api/status': 'handle_status_request',
+        '/api/stats': 'handle_stats_request',
+        '/api/activity': 'handle_activity_request',
+        '/api/health': 'handle_health_request',
+        '/api/config': 'handle_config_request',
+        '/api/env': 'handle_env_request',
+        '/api/current-agents': 'handle_current_agents_request',  # NEW: Current session agents
+        # NEW PERFORMANCE ENDPOINTS
+        '/api/performance-data': 'handle_performance_data_request',
+        '/api/performance/weekly': 'handle_weekly_performance_request',
+        '/api/performance/realtime': 'handle_real_time_metrics_request',
+        '/api/performance/agents': 'handle_agent_performance_request',
+    }
+
+    # Path -> (handler method name, whether the handler takes the parsed JSON body)
+    _POST_ROUTES = {
+        '/api/start-automation': ('handle_start_automation', True),
+        '/api/start-task': ('handle_start_automation', True),
+        '/api/stop-automation': ('handle_stop_automation', False),
+        '/api/reset-stats': ('handle_reset_stats', False),
+        '/api/config/save': ('handle_save_config', True),
+        '/api/env/update': ('handle_env_update', True),
+        # NEW PERFORMANCE TRACKING POST ENDPOINTS
+        '/api/performance/alerts': ('handle_performance_alerts_update', True),
+    }
+
     def do_GET(self):
         """Handle GET requests from React Agentic_UI"""
         try:
-            parsed_path = urlparse(self.path)
-            path = parsed_path.path
-
-            if path == "/api/workflow_status":
-                with workflow_status_lock:
-                    status = workflow_status.copy()
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(status).encode())
+            name = self._GET_ROUTES.get(urlparse(self.path).path)
+            if name is None:
+                self._send_fast_200(_ERR_NOT_FOUND)
                 return
-
-            self.send_response(200)
-            self.send_cors_headers()
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-
-            if path == '/api/status':
-                self.handle_status_request()
-            elif path == '/api/stats':
-                self.handle_stats_request()
-            elif path == '/api/activity':
-                self.handle_activity_request()
-            elif path == '/api/health':
-                self.handle_health_request()
-            elif path == '/api/config':
-                self.handle_config_request()
-            elif path == '/api/env':
-                self.handle_env_request()
-            elif path == '/api/current-agents':  # NEW: Current session agents
-                self.handle_current_agents_request()
-            # NEW PERFORMANCE ENDPOINTS
-            elif path == '/api/performance-data':
-                self.handle_performance_data_request()
-            elif path == '/api/performance/weekly':
-                self.handle_weekly_performance_request()
-            elif path == '/api/performance/realtime':
-                self.handle_real_time_metrics_request()
-            elif path == '/api/performance/agents':
-                self.handle_agent_performance_request()
-            else:
-                self.wfile.write(json.dumps({"error": "Endpoint not found"}).encode('utf-8'))
+            getattr(self, name)()
 
         except Exception as e:
             logger.error(f'Error handling GET request: {e}')
             try:
-                self.send_response(500)
-                self.send_cors_headers()
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+                self._send_raw(b"500 Internal Server Error", _json_dumps({"success": False, "error": str(e)}))
             except:
                 pass
 
@@ -172,135 +417,129 @@ class ReactUIHandler(BaseHTTPRequestHandler):
         """Handle POST requests from React Agentic_UI"""
         try:
             content_length = int(self.headers.get('Content-Length', 0))
-            # Send proper HTTP response with CORS
-            self.send_response(200)
-            self.send_cors_headers()
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-
-            if self.path == '/api/start-automation' or self.path == '/api/start-task':
-                if content_length > 0:
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    self.handle_start_automation(data)
-                else:
-                    self.wfile.write(json.dumps({"success": False, "error": "No data provided"}).encode('utf-8'))
-            elif self.path == '/api/stop-automation':
-                self.handle_stop_automation()
-            elif self.path == '/api/reset-stats':
-                self.handle_reset_stats()
-            elif self.path == '/api/config/save':
-                if content_length > 0:
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    self.handle_save_config(data)
-                else:
-                    self.wfile.write(json.dumps({"success": False, "error": "No data provided"}).encode('utf-8'))
-            elif self.path == '/api/env/update':
-                if content_length > 0:
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    self.handle_env_update(data)
-                else:
-                    self.wfile.write(json.dumps({"success": False, "error": "No data provided"}).encode('utf-8'))
-            # NEW PERFORMANCE TRACKING POST ENDPOINTS
-            elif self.path == '/api/performance/alerts':
-                if content_length > 0:
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    self.handle_performance_alerts_update(data)
-                else:
-                    self.wfile.write(json.dumps({"success": False, "error": "No data provided"}).encode('utf-8'))
+            # Always consume the body so the next request on a kept-alive connection starts clean
+            body = self._read_body(content_length) if content_length > 0 else None
+            route = self._POST_ROUTES.get(self.path)
+            if route is None:
+                self._send_fast_200(_ERR_NOT_FOUND)
+                return
+            name, takes_body = route
+            if not takes_body:
+                getattr(self, name)()
+            elif body is not None:
+                getattr(self, name)(_json_loads(body))
             else:
-                self.wfile.write(json.dumps({"error": "Endpoint not found"}).encode('utf-8'))
+                self._send_fast_200(_ERR_NO_DATA)
         except Exception as e:
             logger.error(f'Error handling POST request: {e}')
             try:
-                self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+                self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
             except:
                 pass
 
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
-        self.send_response(200)
-        self.send_cors_headers()
-        self.end_headers()
-
-    def send_cors_headers(self):
-        """Send CORS headers for React development"""
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.send_header('Access-Control-Max-Age', '3600')
+        self._send_raw(b"200 OK", headers=_CORS_HEADERS)
+
+    def _read_body(self, n: int) -> memoryview:
+        """Read an n-byte request body into this thread's pooled buffer and return a view of it"""
+        buf = getattr(_tls, "buf", None)
+        if buf is None or len(buf) < n:
+            buf = bytearray(max(POST_BUFFER_SIZE, n))
+            _tls.buf = buf
+        view = memoryview(buf)[:n]
+        received = 0
+        while received < n:
+            chunk = self.rfile.readinto(view[received:])
+            if not chunk:
+                raise ConnectionError(f"Request body truncated ({received} of {n} bytes)")
+            received += chunk
+        return view
+
+    def _send_raw(self, status: bytes, body: bytes = b"", headers: bytes = _CORS_AND_JSON):
+        """Write the status line, prebuilt headers, Content-Length and body as a single socket write"""
+        self.wfile.write(b"%s %s\r\nContent-Length: %d\r\n%s\r\n%s" % (
+            self.protocol_version.encode('ascii'), status, len(body), headers, body))
+
+    def _send_fast_200(self, body: bytes):
+        """Write a complete 200 JSON response using the prebuilt CORS/content-type header block"""
+        self._send_raw(b"200 OK", body)
+
+    def handle_workflow_status_request(self):
+        """Handle workflow status polling request"""
+        self._send_fast_200(_cached_response('/api/workflow_status', STATUS_CACHE_TTL, _workflow_status_snapshot))
 
     def handle_status_request(self):
         """Handle system status request - delegate to router"""
         try:
-            status_data = core.router.get_system_status()
-            self.wfile.write(json.dumps(status_data, indent=2).encode('utf-8'))
-            core.router.safe_stats_update({'ui_requests': 1})
+            body = _cached_response('/api/status', STATUS_CACHE_TTL, _router().get_system_status, indent=True)
+            _router().safe_stats_update({'ui_requests': 1})
+            self._send_fast_200(body)
         except Exception as e:
             logger.error(f"Status request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_stats_request(self):
         """Handle statistics request - delegate to router"""
         try:
-            stats_data = core.router.get_system_stats()
-            self.wfile.write(json.dumps(stats_data, indent=2).encode('utf-8'))
+            self._send_fast_200(_cached_response('/api/stats', STATUS_CACHE_TTL,
+                                                _router().get_system_stats, indent=True))
         except Exception as e:
             logger.error(f"Stats request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_activity_request(self):
         """Handle activity log request - delegate to router"""
         try:
-            activity_data = core.router.get_system_activity()
-            self.wfile.write(json.dumps(activity_data, indent=2).encode('utf-8'))
+            activity_data = _router().get_system_activity()
+            self._send_fast_200(_json_dumps(activity_data, indent=True))
         except Exception as e:
             logger.error(f"Activity request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_health_request(self):
         """Handle health check request"""
         try:
-            health_data = {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "uptime": "running",
-                "version": "3.0.0",
-                "performance_tracking": performance_tracker is not None,
-                "mongodb_connected": self._check_mongodb_connection()
-            }
-            self.wfile.write(json.dumps(health_data, indent=2).encode('utf-8'))
+            self._send_fast_200(_cached_response('/api/health', HEALTH_CACHE_TTL, self._build_health_data, indent=True))
         except Exception as e:
             logger.error(f"Health request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
+
+    def _build_health_data(self) -> Dict[str, Any]:
+        """Build the health check payload"""
+        return {
+            "status": "healthy",
+            "timestamp": _approx_now_iso(),
+            "uptime": "running",
+            "version": "3.0.0",
+            "performance_tracking": performance_tracker is not None,
+            "mongodb_connected": self._check_mongodb_connection()
+        }
 
     def handle_config_request(self):
         """Handle configuration request - delegate to router"""
         try:
-            config_data = core.router.get_system_config()
-            self.wfile.write(json.dumps(config_data, indent=2).encode('utf-8'))
+            config_data = _router().get_system_config()
+            self._send_fast_200(_json_dumps(config_data, indent=True))
         except Exception as e:
             logger.error(f"Config request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_env_request(self):
         """Handle environment variables request - delegate to router"""
         try:
-            env_vars = core.router.get_system_env_vars()
-            self.wfile.write(json.dumps(env_vars, indent=2).encode('utf-8'))
+            env_vars = _router().get_system_env_vars()
+            self._send_fast_200(_json_dumps(env_vars, indent=True))
         except Exception as e:
             logger.error(f"Env request error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_env_update(self, data):
         """Handle environment variables update request"""
         try:
             updates = data.get('updates', {})
             if not updates:
-                self.wfile.write(json.dumps({"success": False, "error": "No updates provided"}).encode('utf-8'))
+                self._send_fast_200(_ERR_NO_UPDATES)
                 return
             # Update the .env file
             success = update_env_file(updates)
@@ -310,13 +549,13 @@ class ReactUIHandler(BaseHTTPRequestHandler):
                     "message": "Environment variables updated successfully",
                     "updated_at": datetime.now().isoformat()
                 }
-                self.wfile.write(json.dumps(response_data).encode('utf-8'))
+                self._send_fast_200(_json_dumps(response_data))
             else:
-                self.wfile.write(
-                    json.dumps({"success": False, "error": "Failed to update environment variables"}).encode('utf-8'))
+                self._send_fast_200(
+                    _json_dumps({"success": False, "error": "Failed to update environment variables"}))
         except Exception as e:
             logger.error(f"Env update error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_save_config(self, data):
         """Handle configuration save request (legacy endpoint)"""
@@ -324,7 +563,7 @@ class ReactUIHandler(BaseHTTPRequestHandler):
             service_id = data.get('service', 'unknown')
             config_updates = data.get('config', {})
             if not config_updates:
-                self.wfile.write(json.dumps({"success": False, "error": "No configuration provided"}).encode('utf-8'))
+                self._send_fast_200(_ERR_NO_CONFIG)
                 return
             # Update the .env file
             success = update_env_file(config_updates)
@@ -335,226 +574,121 @@ class ReactUIHandler(BaseHTTPRequestHandler):
                     "service": service_id,
                     "saved_at": datetime.now().isoformat()
                 }
-                self.wfile.write(json.dumps(response_data).encode('utf-8'))
+                self._send_fast_200(_json_dumps(response_data))
             else:
-                self.wfile.write(
-                    json.dumps({"success": False, "error": "Failed to save configuration"}).encode('utf-8'))
+                self._send_fast_200(
+                    _json_dumps({"success": False, "error": "Failed to save configuration"}))
         except Exception as e:
             logger.error(f"Config save error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def handle_start_automation(self, data):
         """Handle automation start request from React Agentic_UI - delegate to router"""
         try:
-            result = core.router.handle_ui_automation_request(data)
-            self.wfile.write(json.dumps(result, indent=2).encode('utf-8'))
+            result = _router().handle_ui_automation_request(data)
+            self._send_fast_200(_json_dumps(result, indent=True))
         except Exception as error:
             logger.error(f"Agentic_UI automation request failed: {error}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(error)
-            }).encode('utf-8'))
+            }))
 
     def handle_stop_automation(self):
         """Handle automation stop request from React Agentic_UI - delegate to router"""
         try:
-            result = core.router.stop_ui_automation()
-            self.wfile.write(json.dumps(result, indent=2).encode('utf-8'))
+            result = _router().stop_ui_automation()
+            self._send_fast_200(_json_dumps(result, indent=True))
         except Exception as error:
             logger.error(f"Agentic_UI stop automation request failed: {error}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(error)
-            }).encode('utf-8'))
+            }))
 
     def handle_reset_stats(self):
         """Handle statistics reset request - delegate to router"""
         try:
-            result = core.router.reset_system_stats()
-            self.wfile.write(json.dumps(result, indent=2).encode('utf-8'))
+            result = _router().reset_system_stats()
+            self._send_fast_200(_json_dumps(result, indent=True))
         except Exception as error:
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(error)
-            }).encode('utf-8'))
+            }))
 
     # NEW: Current agents handler
     def handle_current_agents_request(self):
         """Handle current session agent stats request"""
+        timestamp, clock = _now_strings()
         try:
-            if not core.router.router_instance:
+            if not _router().router_instance:
                 # Return default agent stats if router is not initialized
-                current_time = datetime.now().strftime("%I:%M:%S %p")
-                default_agents = [
-                    {
-                        "id": "PlannerAgent",
-                        "name": "Planner",
-                        "status": "active",
-                        "tasksProcessed": 0,
-                        "tokensConsumed": 0,
-                        "lastActivity": current_time
-                    },
-                    {
-                        "id": "AssemblerAgent",  # FIXED: Added missing AssemblerAgent
-                        "name": "Assembler",
-                        "status": "active",
-                        "tasksProcessed": 0,
-                        "tokensConsumed": 0,
-                        "lastActivity": current_time
-                    },
-                    {
-                        "id": "DeveloperAgent",
-                        "name": "Developer",
-                        "status": "active",
-                        "tasksProcessed": 0,
-                        "tokensConsumed": 0,
-                        "lastActivity": current_time
-                    },
-                    {
-                        "id": "ReviewerAgent",
-                        "name": "Reviewer",
-                        "status": "active",
-                        "tasksProcessed": 0,
-                        "tokensConsumed": 0,
-                        "lastActivity": current_time
-                    }
-                ]
-                response = {
-                    "success": True,
-                    "current_agents": default_agents,
-                    "timestamp": datetime.now().isoformat()
-                }
+                current_agents = _default_agents(clock)
             else:
-                current_agents = core.router.router_instance.get_current_agent_stats()
-                response = {
-                    "success": True,
-                    "current_agents": current_agents,
-                    "timestamp": datetime.now().isoformat()
-                }
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+                current_agents = _router().router_instance.get_current_agent_stats()
+            response = {
+                "success": True,
+                "current_agents": current_agents,
+                "timestamp": timestamp
+            }
+            self._send_fast_200(_json_dumps(response))
         except Exception as e:
             logger.error(f"Current agents request error: {e}")
-            current_time = datetime.now().strftime("%I:%M:%S %p")
-            # Return default agents on error - FIXED: Added AssemblerAgent here too
-            default_agents = [
-                {
-                    "id": "PlannerAgent",
-                    "name": "Planner",
-                    "status": "active",
-                    "tasksProcessed": 0,
-                    "tokensConsumed": 0,
-                    "lastActivity": current_time
-                },
-                {
-                    "id": "AssemblerAgent",  # FIXED: Added missing AssemblerAgent
-                    "name": "Assembler",
-                    "status": "active",
-                    "tasksProcessed": 0,
-                    "tokensConsumed": 0,
-                    "lastActivity": current_time
-                },
-                {
-                    "id": "DeveloperAgent",
-                    "name": "Developer",
-                    "status": "active",
-                    "tasksProcessed": 0,
-                    "tokensConsumed": 0,
-                    "lastActivity": current_time
-                },
-                {
-                    "id": "ReviewerAgent",
-                    "name": "Reviewer",
-                    "status": "active",
-                    "tasksProcessed": 0,
-                    "tokensConsumed": 0,
-                    "lastActivity": current_time
-                }
-            ]
+            # Return default agents on error
             response = {
                 "success": True,
-                "current_agents": default_agents,
-                "timestamp": datetime.now().isoformat()
+                "current_agents": _default_agents(clock),
+                "timestamp": timestamp
             }
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self._send_fast_200(_json_dumps(response))
 
     # NEW: Performance data handler
     def handle_performance_data_request(self):
         """Handle performance data request for the last 7 days"""
         try:
-            performance_data = performance_tracker.get_last_7_days_data()
-
-            response_data = {
-                "success": True,
-                "performance_data": performance_data,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            self.wfile.write(json.dumps(response_data).encode('utf-8'))
-
+            self._send_fast_200(_perf_snapshot.get("last7"))
         except Exception as e:
             logger.error(f"Performance data request error: {e}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(e),
                 "performance_data": []
-            }).encode('utf-8'))
+            }))
 
     def handle_weekly_performance_request(self):
         """Handle weekly performance data request"""
         try:
             # Get last 7 days data instead of weekly data (method doesn't exist)
-            performance_data = performance_tracker.get_last_7_days_data()
-
-            response_data = {
-                "success": True,
-                "performance_data": performance_data,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            self.wfile.write(json.dumps(response_data).encode('utf-8'))
-
+            self._send_fast_200(_perf_snapshot.get("last7"))
         except Exception as e:
             logger.error(f"Weekly performance request error: {e}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(e)
-            }).encode('utf-8'))
+            }))
 
     def handle_real_time_metrics_request(self):
         """Handle real-time metrics request"""
         try:
-            real_time_data = performance_tracker.get_real_time_metrics()
-            response = {
-                "success": True,
-                "data": real_time_data,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.wfile.write(json.dumps(response).encode('utf-8'))
-
+            self._send_fast_200(_perf_snapshot.get("realtime"))
         except Exception as e:
             logger.error(f"Real-time metrics request error: {e}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(e)
-            }).encode('utf-8'))
+            }))
 
     def handle_agent_performance_request(self):
         """Handle agent performance data request"""
         try:
-            agent_data = performance_tracker.get_agent_performance_data()
-            response = {
-                "success": True,
-                "agent_performance": agent_data,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.wfile.write(json.dumps(response).encode('utf-8'))
-
+            self._send_fast_200(_perf_snapshot.get("agents"))
         except Exception as e:
             logger.error(f"Agent performance request error: {e}")
-            self.wfile.write(json.dumps({
+            self._send_fast_200(_json_dumps({
                 "success": False,
                 "error": str(e)
-            }).encode('utf-8'))
+            }))
 
     def handle_performance_alerts_update(self, data):
         """Handle performance alerts configuration update"""
@@ -567,39 +701,69 @@ class ReactUIHandler(BaseHTTPRequestHandler):
                 "config": alert_config,
                 "updated_at": datetime.now().isoformat()
             }
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self._send_fast_200(_json_dumps(response))
         except Exception as e:
             logger.error(f"Performance alerts update error: {e}")
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
+            self._send_fast_200(_json_dumps({"success": False, "error": str(e)}))
 
     def _check_mongodb_connection(self) -> bool:
-        """Check if MongoDB connection is active"""
-        try:
-            if performance_tracker is not None and hasattr(performance_tracker, 'client'):
-                # Try to ping the database
-                performance_tracker.client.admin.command('ping')
-                return True
-        except Exception:
-            pass
-        return False
+        """Check if MongoDB connection is active (ping result is cached for MONGO_HEALTH_TTL seconds)"""
+        now = time.monotonic()
+        with _mongo_health_lock:
+            if now - _mongo_health["ts"] < MONGO_HEALTH_TTL:
+                return _mongo_health["ok"]
+            ok = False
+            try:
+                if performance_tracker is not None and hasattr(performance_tracker, 'client'):
+                    # Try to ping the database
+                    performance_tracker.client.admin.command('ping')
+                    ok = True
+            except Exception:
+                pass
+            _mongo_health["ts"] = now
+            _mongo_health["ok"] = ok
+            return ok
 
 def start_ui_server():
     """Start HTTP server for React Agentic_UI communication"""
     global ui_server, ui_server_thread
     try:
-        # Create HTTP server with thread-safe handler
-        class ThreadedHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
-            daemon_threads = True
+        _ensure_tracker()
+        # Create HTTP server that hands accepted connections to a bounded pool of warm worker threads
+        class PooledHTTPServer(HTTPServer):
             allow_reuse_address = True
-
-        ui_server = ThreadedHTTPServer((config.UI_HOST, config.UI_PORT), ReactUIHandler)
-        # Start server in separate thread
-        ui_server_thread = threading.Thread(
-            target=ui_server.serve_forever,
-            daemon=True,
-            name="ReactUIServer"
-        )
-        ui_server_thread.start()
+            request_queue_size = 128
+
+            def __init__(self, server_address, handler_class):
+                super().__init__(server_address, handler_class)
+                self._pool = ThreadPoolExecutor(max_workers=UI_SERVER_WORKERS, thread_name_prefix="ui")
+
+            def process_request(self, request, client_address):
+                self._pool.submit(self._process_request_worker, request, client_address)
+
+            def _process_request_worker(self, request, client_address):
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                finally:
+                    self.shutdown_request(request)
+
+            def server_close(self):
+                super().server_close()
+                self._pool.shutdown(wait=False, cancel_futures=True)
+
+        with _globals_lock:
+            ui_server = PooledHTTPServer((config.UI_HOST, config.UI_PORT), ReactUIHandler)
+            # Start server in separate thread
+            ui_server_thread = threading.Thread(
+                target=ui_server.serve_forever,
+                daemon=True,
+                name="ReactUIServer"
+            )
+            ui_server_thread.start()
+        _perf_snapshot.start()
+        _router().register_activity_listener()
         logger.info(f"React Agentic_UI API server started on http://{config.UI_HOST}:{config.UI_PORT}")
         logger.info(f"React development server should be running on http://localhost:{config.REACT_DEV_PORT}")
         if performance_tracker is not None:
@@ -613,11 +777,17 @@ def start_ui_server():
 
 def stop_ui_server():
     """Stop the Agentic_UI server"""
-    global ui_server
-    if ui_server:
+    global ui_server, ui_server_thread
+    _perf_snapshot.stop()
+    with _globals_lock:
+        server = ui_server
+        ui_server = None
+        ui_server_thread = None
+    if server:
+        _router().unregister_activity_listener()
         try:
-            ui_server.shutdown()
-            ui_server.server_close()
+            server.shutdown()
+            server.server_close()
             logger.info("React Agentic_UI server stopped")
         except Exception as error:
             logger.error(f"Error stopping Agentic_UI server: {error}")
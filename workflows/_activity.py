@@ -0,0 +1,74 @@
+"""
+Shared helpers for the UI activity entries written by the JIRA workflows
+Every workflow stamps its entries the same way, so ids and timestamps are comparable across agents.
+Entries are buffered per thread and handed to the router in one locked append (see flush_activity).
+"""
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Buffered entries are flushed early once a thread has this many waiting
+ACTIVITY_FLUSH_SIZE = 32
+
+# Per-thread activity entries awaiting one bulk append to the router
+_buffer = threading.local()
+# core.router module, imported on first use (a top-level import would be circular)
+_router = None
+
+# Activity entry ids: process id + counter (next() on itertools.count is atomic)
+_PID = os.getpid()
+_ids = itertools.count()
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for iso_now; replaced atomically as a tuple
+_iso_second = (0, "")
+
+
+def iso_now() -> str:
+    """Local ISO-8601 timestamp (microseconds) - the date/time part is formatted once per second"""
+    global _iso_second
+    now = time.time()
+    second = int(now)
+    cached = _iso_second
+    if cached[0] != second:
+        cached = _iso_second = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+    return f"{cached[1]}.{int((now - second) * 1_000_000):06d}"
+
+
+def activity_id() -> str:
+    """Id for a UI activity entry, unique within this process's activity log (pid-prefixed across processes)"""
+    return f"{_PID}-{next(_ids)}"
+
+
+def get_router():
+    """Return the core.router module, importing it on first use"""
+    global _router
+    if _router is None:
+        import core.router
+        _router = core.router
+    return _router
+
+
+def buffer_activity(entry: Dict[str, Any]):
+    """Queue an activity entry on this thread (written by flush_activity, or once ACTIVITY_FLUSH_SIZE are waiting)"""
+    entries = getattr(_buffer, "entries", None)
+    if entries is None:
+        entries = _buffer.entries = []
+    entries.append(entry)
+    if len(entries) >= ACTIVITY_FLUSH_SIZE:
+        flush_activity()
+
+
+def flush_activity():
+    """Hand this thread's buffered activity entries to the router in one locked append"""
+    entries = getattr(_buffer, "entries", None)
+    if not entries:
+        return
+    _buffer.entries = []
+    try:
+        get_router().safe_activity_log_bulk(entries)
+    except Exception as e:
+        logger.warning("Failed to log %s activity entries to UI: %s", len(entries), e)
@@ -0,0 +1,80 @@
+"""
+Background writer for workflow artifacts (deployment markdown, generated project files)
+Local copies are convenience output, so they are written off the LLM pipeline's request path.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Artifacts are written with raw os.write calls of at most this many bytes (no buffered stream layer)
+WRITE_CHUNK_SIZE = 1 << 20
+
+
+def _write_all(path: str, data: bytes):
+    """Write data to path with a single open and as few write syscalls as possible"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view[:WRITE_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+class AsyncArtifactWriter:
+    """Writes (path, bytes) jobs on a daemon thread; flush() blocks until every submitted job is on disk"""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        # Directories already created by the worker thread (only touched from that thread)
+        self._created_dirs = set()
+
+    def submit(self, path: str, data: bytes):
+        """Queue data to be written to path, creating parent directories as needed"""
+        self._ensure_worker()
+        self._jobs.put((path, data))
+
+    def flush(self):
+        """Block until all queued artifacts have been written"""
+        if self._worker is not None:
+            self._jobs.join()
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True, name="artifact-writer")
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            path, data = self._jobs.get()
+            try:
+                directory = os.path.dirname(path)
+                if directory and directory not in self._created_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    self._created_dirs.add(directory)
+                try:
+                    _write_all(path, data)
+                except FileNotFoundError:
+                    # Directory was removed since it was cached - recreate it and retry once
+                    os.makedirs(directory, exist_ok=True)
+                    _write_all(path, data)
+                logger.debug("Saved artifact to %s", path)
+            except Exception as e:
+                logger.error(f"Failed to save artifact {path}: {e}")
+            finally:
+                self._jobs.task_done()
+
+
+# Global instance shared by the workflows
+artifact_writer = AsyncArtifactWriter()
+atexit.register(artifact_writer.flush)
@@ -0,0 +1,154 @@
+"""
+Shared MongoDB helpers for the JIRA workflows
+Feedback documents are observability data, so they are buffered and written in batches
+instead of paying one insert round-trip per issue.
+"""
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+from pymongo import MongoClient, WriteConcern
+from pymongo.errors import OperationFailure
+
+from config.settings import config as app_config
+
+logger = logging.getLogger(__name__)
+
+# One client (and so one connection pool and monitor thread) shared by every workflow instance
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# "db.collection" names whose feedback indexes were already ensured by this process
+_INDEXED = set()
+_INDEXED_LOCK = threading.Lock()
+
+# Feedback documents are best-effort observability data, so writes are not acknowledged
+FEEDBACK_WRITE_CONCERN = WriteConcern(w=0)
+
+# Flush once this many documents are buffered, or when the oldest buffered document is this old
+BATCH_SIZE = 50
+BATCH_MAX_AGE_SECONDS = 5.0
+# How often the background flusher looks for buffers older than their max age
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# Every BatchedInserter, for the background flusher and the single exit hook
+_INSERTERS = []
+_INSERTERS_LOCK = threading.Lock()
+_FLUSHER = None
+
+
+def get_client() -> MongoClient:
+    """Return the process-wide MongoClient, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = MongoClient(
+                    app_config.MONGODB_CONNECTION_STRING,
+                    maxPoolSize=50,
+                    minPoolSize=5,
+                    retryWrites=True
+                )
+    return _CLIENT
+
+
+def ensure_feedback_indexes(collection, label: str):
+    """Create the issue/date lookup indexes on a workflow feedback collection (once per process)"""
+    key = collection.full_name
+    with _INDEXED_LOCK:
+        if key in _INDEXED:
+            return
+        _INDEXED.add(key)
+    try:
+        collection.create_index([("issue_key", 1), ("timestamp", -1)], background=True)
+        collection.create_index([("date", 1), ("agent_type", 1)], background=True)
+    except OperationFailure as e:
+        logger.warning("[%s] Could not create MongoDB indexes: %s", label, e)
+
+
+def _flush_all():
+    """Write every inserter's buffered documents (registered once as the interpreter exit hook)"""
+    with _INSERTERS_LOCK:
+        inserters = list(_INSERTERS)
+    for inserter in inserters:
+        inserter.flush()
+
+
+def _run_flusher():
+    """Background loop writing buffers whose oldest document has reached its max age"""
+    while True:
+        time.sleep(FLUSH_INTERVAL_SECONDS)
+        with _INSERTERS_LOCK:
+            inserters = list(_INSERTERS)
+        for inserter in inserters:
+            inserter.flush_stale()
+
+
+def _register(inserter: "BatchedInserter"):
+    """Track an inserter and start the background flusher on first use"""
+    global _FLUSHER
+    with _INSERTERS_LOCK:
+        _INSERTERS.append(inserter)
+        if _FLUSHER is None:
+            _FLUSHER = threading.Thread(target=_run_flusher, daemon=True, name="mongo-batch-flusher")
+            _FLUSHER.start()
+
+
+atexit.register(_flush_all)
+
+
+class BatchedInserter:
+    """
+    Thread-safe write buffer for a MongoDB collection
+    Documents are written with insert_many(ordered=False) once BATCH_SIZE accumulate; a background
+    thread writes any buffer whose oldest document is BATCH_MAX_AGE_SECONDS old, so quiet periods
+    do not hold documents in memory. Anything left is flushed at interpreter exit.
+    """
+
+    def __init__(self, collection, label: str, batch_size: int = BATCH_SIZE,
+                 max_age: float = BATCH_MAX_AGE_SECONDS):
+        self.collection = collection
+        self.label = label
+        self.batch_size = batch_size
+        self.max_age = max_age
+        self._buf: List[Dict[str, Any]] = []
+        self._buf_lock = threading.Lock()
+        self._oldest = 0.0
+        _register(self)
+
+    def add(self, document: Dict[str, Any]):
+        """Buffer a document, writing the whole batch if it is full or stale"""
+        with self._buf_lock:
+            if not self._buf:
+                self._oldest = time.monotonic()
+            self._buf.append(document)
+            if len(self._buf) < self.batch_size and time.monotonic() - self._oldest < self.max_age:
+                return
+            batch, self._buf = self._buf, []
+        self._write(batch)
+
+    def flush_stale(self):
+        """Write the buffered documents if the oldest one has reached max_age"""
+        with self._buf_lock:
+            if not self._buf or time.monotonic() - self._oldest < self.max_age:
+                return
+            batch, self._buf = self._buf, []
+        self._write(batch)
+
+    def flush(self):
+        """Write any buffered documents now"""
+        with self._buf_lock:
+            batch, self._buf = self._buf, []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        try:
+            # No bypass_document_validation: pymongo refuses it with the unacknowledged FEEDBACK_WRITE_CONCERN
+            self.collection.insert_many(batch, ordered=False)
+            # len(batch), not inserted_ids: pymongo leaves RawBSONDocument ids (planner batches) out of it.
+            # Feedback collections are w=0, so this only means the batch was sent, not that it was stored
+            logger.info("[%s] Sent %s document(s) to MongoDB", self.label, len(batch))
+        except Exception as e:
+            logger.error("[%s] Failed to send %s document(s) to MongoDB: %s", self.label, len(batch), e)
@@ -11,15 +11,32 @@ This keeps JIRA-specific logic separate from the core assembly logic.
 """
 import logging
 import os
+import time
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Any, List, Optional
-from pymongo import MongoClient
 
 from agents.core_assembler_agent import CoreAssemblerAgent
 from config.settings import config as app_config
+from workflows._activity import activity_id, iso_now
+from workflows._async_writer import artifact_writer
+from workflows._mongo import FEEDBACK_WRITE_CONCERN, BatchedInserter, ensure_feedback_indexes, get_client
 
 logger = logging.getLogger(__name__)
 
+# JIRA fields already passed to the assembler as requirements/identifier/title
+_CONTEXT_EXCLUDED_FIELDS = frozenset({'description', 'key', 'summary'})
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap text at limit chars, marking the cut with '...'"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _fmt_file(f: Dict[str, Any]) -> str:
+    """Format one file-structure entry for the UI summary (description capped at 80 chars)"""
+    return f"• {f.get('filename', '')} ({f.get('type', '')}): {_truncate(f.get('description', ''), 80)}"
+
 
 class JiraAssemblerWorkflow:
     """
@@ -27,13 +44,20 @@ class JiraAssemblerWorkflow:
     Handles JIRA issue processing, MongoDB storage, and UI integration
     """
 
+    # core.router module, imported on first UI log (a top-level import would be circular)
+    _router = None
+
     def __init__(self, config):
         self.config = config
         self.core_assembler = CoreAssemblerAgent(config)
+        # Settings read on every store, resolved once
+        self._llm_model = app_config.ASSEMBLER_LLM_MODEL or "unknown"
+        self._db_name = app_config.MONGODB_DATABASE
+        self._coll_name = app_config.ASSEMBLER_FEEDBACK
 
         # Initialize MongoDB for JIRA-specific storage
-        self.mongo_client = None
         self.mongo_collection = None
+        self._inserter = None
         self._initialize_mongodb()
 
         logger.info("JIRA Assembler Workflow initialized")
@@ -46,13 +70,15 @@ class JiraAssemblerWorkflow:
                 logger.warning("MONGODB_CONNECTION_STRING not set - JIRA assembler storage disabled")
                 return
 
-            self.mongo_client = MongoClient(conn_str)
-            db_name = app_config.MONGODB_DATABASE
-            coll_name = app_config.ASSEMBLER_FEEDBACK
-            db = self.mongo_client[db_name]
-            self.mongo_collection = db[coll_name]
+            db_name = self._db_name
+            coll_name = self._coll_name
+            db = get_client()[db_name]
+            # Indexes are created with the default (acknowledged) write concern so failures surface
+            ensure_feedback_indexes(db[coll_name], "JIRA-ASSEMBLER")
+            self.mongo_collection = db.get_collection(coll_name, write_concern=FEEDBACK_WRITE_CONCERN)
+            self._inserter = BatchedInserter(self.mongo_collection, label="JIRA-ASSEMBLER")
 
-            logger.info(f"JIRA Assembler MongoDB ready - Collection: {coll_name}")
+            logger.info("JIRA Assembler MongoDB ready - Collection: %s", coll_name)
         except Exception as e:
             logger.error(f"JIRA Assembler MongoDB init failed: {e}")
             self.mongo_collection = None
@@ -64,42 +90,44 @@ class JiraAssemblerWorkflow:
             return
 
         try:
+            now = datetime.now()
             document = {
                 "agent_type": "assembler",
                 "issue_key": issue_key,
                 "deployment_document": deployment_doc,
-                "timestamp": datetime.now(),
-                "date": datetime.now().date().isoformat(),
-                "llm_model": app_config.ASSEMBLER_LLM_MODEL or "unknown",
+                "timestamp": now,
+                "date": now.date().isoformat(),
+                "llm_model": self._llm_model,
                 "tokens_used": tokens_used
             }
 
-            result = self.mongo_collection.insert_one(document)
-            logger.info(f"[JIRA-ASSEMBLER] Stored document for {issue_key} in MongoDB: ID {result.inserted_id}")
+            self._inserter.add(document)
+            logger.info("[JIRA-ASSEMBLER] Queued document for %s for MongoDB storage", issue_key)
         except Exception as e:
             logger.error(f"[JIRA-ASSEMBLER] Failed to store in MongoDB: {e}")
 
     def _save_markdown_locally(self, issue_key: str, markdown_content: str):
-        """Save markdown document to local folder"""
+        """Queue markdown document for saving to local folder (written by the background artifact writer)"""
         if os.getenv("LOCAL_STORAGE", "True").lower() != "true" or not markdown_content:
             return
         try:
-            local_folder = "deployment_documents"
-            os.makedirs(local_folder, exist_ok=True)
-            md_path = os.path.join(local_folder, f"{issue_key}.md")
-
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            md_path = os.path.join("deployment_documents", f"{issue_key}.md")
+            artifact_writer.submit(md_path, markdown_content.encode('utf-8'))
 
-            logger.info(f"[JIRA-ASSEMBLER] Saved markdown to {md_path}")
+            logger.info("[JIRA-ASSEMBLER] Queued markdown for %s", md_path)
         except Exception as e:
             logger.error(f"[JIRA-ASSEMBLER] Failed to save markdown: {e}")
 
     def _log_to_ui(self, issue_key: str, deployment_doc: Dict):
         """Log assembly results to UI"""
         try:
-            import core.router
-            import uuid
+            router = JiraAssemblerWorkflow._router
+            if router is None:
+                import core.router
+                router = JiraAssemblerWorkflow._router = core.router
+            # Nothing consumes the activity log in headless runs - skip building the entry
+            if not router.LISTENERS:
+                return
 
             # Extract document sections for UI display
             document_sections = []
@@ -107,32 +135,28 @@ class JiraAssemblerWorkflow:
             # Project Overview
             project_overview = deployment_doc.get("project_overview", {})
             if project_overview:
-                desc = project_overview.get("description", "")
+                desc = _truncate(project_overview.get("description", ""), 200)
                 proj_type = project_overview.get("project_type", "")
                 arch = project_overview.get("architecture", "")
-                content = f"Type: {proj_type}\nArchitecture: {arch}\n\n{desc[:200]}..." if len(desc) > 200 else f"Type: {proj_type}\nArchitecture: {arch}\n\n{desc}"
+                content = f"Type: {proj_type}\nArchitecture: {arch}\n\n{desc}"
                 document_sections.append({"title": "Project Overview", "content": content})
 
             # File Structure
             file_structure = deployment_doc.get("file_structure", {})
             if file_structure and file_structure.get("files"):
                 files = file_structure.get("files", [])
-                file_list = "\n".join([
-                    f"• {f.get('filename', '')} ({f.get('type', '')}): {f.get('description', '')[:80]}..."
-                    if len(f.get('description', '')) > 80
-                    else f"• {f.get('filename', '')} ({f.get('type', '')}): {f.get('description', '')}"
-                    for f in files[:5]
-                ])
-                if len(files) > 5:
-                    file_list += f"\n... and {len(files) - 5} more files"
-                document_sections.append({"title": f"File Structure ({len(files)} files)", "content": file_list})
+                file_count = len(files)
+                file_list = "\n".join(_fmt_file(f) for f in islice(files, 5))
+                if file_count > 5:
+                    file_list += f"\n... and {file_count - 5} more files"
+                document_sections.append({"title": f"File Structure ({file_count} files)", "content": file_list})
 
             # Implementation Plan
             impl_plan = deployment_doc.get("implementation_plan", {})
             if impl_plan:
                 phases = impl_plan.get("phases", [])
                 if phases:
-                    phase_text = "\n".join([f"Phase {i+1}: {p.get('name', 'Unnamed')}" for i, p in enumerate(phases[:3])])
+                    phase_text = "\n".join(f"Phase {i}: {p.get('name', 'Unnamed')}" for i, p in enumerate(islice(phases, 3), 1))
                     if len(phases) > 3:
                         phase_text += f"\n... and {len(phases) - 3} more phases"
                     document_sections.append({"title": "Implementation Plan", "content": phase_text})
@@ -141,15 +165,14 @@ class JiraAssemblerWorkflow:
             tech_specs = deployment_doc.get("technical_specifications", {})
             if tech_specs:
                 spec_count = len(tech_specs)
-                spec_files = list(tech_specs.keys())[:3]
-                spec_text = f"Specifications for {spec_count} file(s):\n" + "\n".join([f"• {f}" for f in spec_files])
+                spec_text = f"Specifications for {spec_count} file(s):\n" + "\n".join(f"• {f}" for f in islice(tech_specs, 3))
                 if spec_count > 3:
                     spec_text += f"\n... and {spec_count - 3} more"
                 document_sections.append({"title": "Technical Specifications", "content": spec_text})
 
-            core.router.safe_activity_log({
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
+            router.safe_activity_log({
+                "id": activity_id(),
+                "timestamp": iso_now(),
                 "agent": "AssemblerAgent",
                 "action": "Document Assembly Completed",
                 "details": f"Created deployment document for {issue_key}",
@@ -158,9 +181,9 @@ class JiraAssemblerWorkflow:
                 "documentSections": document_sections
             })
 
-            logger.info(f"[JIRA-ASSEMBLER] UI Log: {issue_key} - Document created with {len(document_sections)} sections")
+            logger.info("[JIRA-ASSEMBLER] UI Log: %s - Document created with %s sections", issue_key, len(document_sections))
         except Exception as e:
-            logger.warning(f"[JIRA-ASSEMBLER] Failed to log to UI: {e}")
+            logger.warning("[JIRA-ASSEMBLER] Failed to log to UI: %s", e)
 
     def create_deployment_document(
         self,
@@ -189,9 +212,9 @@ class JiraAssemblerWorkflow:
             thread_id = f"JIRA-ASSEMBLER-{os.getpid()}"
 
         issue_key = issue_data.get('key', 'UNKNOWN')
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
-        logger.info(f"[JIRA-ASSEMBLER-{thread_id}] Starting document assembly for JIRA issue {issue_key}")
+        logger.info("[JIRA-ASSEMBLER-%s] Starting document assembly for JIRA issue %s", thread_id, issue_key)
 
         try:
             # Extract JIRA-specific data
@@ -202,9 +225,11 @@ class JiraAssemblerWorkflow:
                 "project": issue_data.get('project', {}),
                 "priority": issue_data.get('priority', ''),
                 "issue_type": issue_data.get('issuetype', ''),
-                # Include any additional JIRA fields
-                **{k: v for k, v in issue_data.items() if k not in ['description', 'key', 'summary']}
             }
+            # Include any additional JIRA fields
+            for k, v in issue_data.items():
+                if k not in _CONTEXT_EXCLUDED_FIELDS:
+                    context[k] = v
 
             # Call core assembler
             result = self.core_assembler.assemble(
@@ -214,27 +239,20 @@ class JiraAssemblerWorkflow:
                 thread_id=thread_id
             )
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             if result.get("success"):
                 deployment_doc = result.get("document", {})
                 markdown = result.get("markdown", "")
                 tokens = result.get("tokens_used", 0)
 
-                # Store to MongoDB (JIRA-specific)
-                self._store_to_mongodb(
-                    issue_key=issue_key,
-                    deployment_doc=deployment_doc,
-                    tokens_used=tokens
-                )
-
-                # Save markdown locally (JIRA-specific)
+                # JIRA-specific post-processing: store to MongoDB, save markdown locally, log to UI
+                # (the insert and the markdown write are queued, so none of these block on I/O)
+                self._store_to_mongodb(issue_key=issue_key, deployment_doc=deployment_doc, tokens_used=tokens)
                 self._save_markdown_locally(issue_key, markdown)
-
-                # Log to UI (JIRA-specific)
                 self._log_to_ui(issue_key, deployment_doc)
 
-                logger.info(f"[JIRA-ASSEMBLER-{thread_id}] Completed for {issue_key} in {duration:.1f}s")
+                logger.info("[JIRA-ASSEMBLER-%s] Completed for %s in %.1fs", thread_id, issue_key, duration)
 
                 return {
                     "success": True,
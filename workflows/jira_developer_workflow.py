@@ -12,13 +12,18 @@ It handles:
 This keeps JIRA-specific logic separate from the core development logic.
 """
 import logging
+import os
+import queue
 import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
-from pymongo import MongoClient
+from typing import Dict, Any, List, Optional
 
 from agents.core_developer_agent import CoreDeveloperAgent
 from config.settings import config as app_config
+from workflows._activity import activity_id, iso_now
+from workflows._async_writer import artifact_writer
+from workflows._mongo import FEEDBACK_WRITE_CONCERN, BatchedInserter, ensure_feedback_indexes, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +34,22 @@ class JiraDeveloperWorkflow:
     Handles JIRA issue processing, MongoDB storage, and UI integration
     """
 
+    # core.router module, imported on first UI log (a top-level import would be circular)
+    _router = None
+    # Set once the queue.Queue -> queue.SimpleQueue hint has been logged
+    _queue_hint_logged = False
+
     def __init__(self, config):
         self.config = config
         self.core_developer = CoreDeveloperAgent(config)
+        # Settings read on every store, resolved once
+        self._llm_model = app_config.DEVELOPER_LLM_MODEL or "unknown"
+        self._db_name = app_config.MONGODB_PERFORMANCE_DATABASE
+        self._coll_name = app_config.MONGODB_AGENT_PERFORMANCE
 
         # Initialize MongoDB for JIRA-specific storage
-        self.mongo_client = None
         self.mongo_collection = None
+        self._inserter = None
         self._initialize_mongodb()
 
         logger.debug("JIRA Developer Workflow initialized")
@@ -48,47 +62,56 @@ class JiraDeveloperWorkflow:
                 logger.warning("MONGODB_CONNECTION_STRING not set - JIRA developer storage disabled")
                 return
 
-            self.mongo_client = MongoClient(conn_str)
-            db_name = app_config.MONGODB_PERFORMANCE_DATABASE
-            coll_name = app_config.MONGODB_AGENT_PERFORMANCE
+            db_name = self._db_name
+            coll_name = self._coll_name
 
-            db = self.mongo_client[db_name]
-            self.mongo_collection = db[coll_name]
-            logger.debug(f"JIRA Developer MongoDB ready - Database: {db_name}, Collection: {coll_name}")
+            db = get_client()[db_name]
+            # Indexes are created with the default (acknowledged) write concern so failures surface
+            ensure_feedback_indexes(db[coll_name], "JIRA-DEVELOPER")
+            self.mongo_collection = db.get_collection(coll_name, write_concern=FEEDBACK_WRITE_CONCERN)
+            self._inserter = BatchedInserter(self.mongo_collection, label="JIRA-DEVELOPER")
+            logger.debug("JIRA Developer MongoDB ready - Database: %s, Collection: %s", db_name, coll_name)
         except Exception as e:
             logger.error(f"JIRA Developer MongoDB init failed: {e}")
             self.mongo_collection = None
 
-    def _store_to_mongodb(self, issue_key: str, tokens_used: int = 0):
-        """Store JIRA-specific developer data to MongoDB"""
+    def _store_to_mongodb(self, issue_key: str, tokens_used: int = 0, files_meta: Optional[List[Dict[str, Any]]] = None):
+        """Store JIRA-specific developer data (with per-file metadata) to MongoDB"""
         if self.mongo_collection is None:
             logger.warning("MongoDB not available - Skipping JIRA developer storage")
             return
 
         try:
+            now = datetime.now()
             document = {
                 "agent_type": "developer",
                 "issue_key": issue_key,
-                "timestamp": datetime.now(),
-                "date": datetime.now().date().isoformat(),
+                "timestamp": now,
+                "date": now.date().isoformat(),
                 "tokens_used": tokens_used,
-                "llm_model": app_config.DEVELOPER_LLM_MODEL or "unknown"
+                "llm_model": self._llm_model,
+                "files": files_meta or []
             }
 
-            result = self.mongo_collection.insert_one(document)
-            logger.info(f"[JIRA-DEVELOPER] Stored data for {issue_key} in MongoDB: ID {result.inserted_id}")
+            self._inserter.add(document)
+            logger.info("[JIRA-DEVELOPER] Queued data for %s for MongoDB storage", issue_key)
         except Exception as e:
             logger.error(f"[JIRA-DEVELOPER] Failed to store in MongoDB: {e}")
 
     def _log_to_ui(self, issue_key: str, file_count: int, thread_id: str):
         """Log development results to UI"""
         try:
-            import core.router
-            import uuid
+            router = JiraDeveloperWorkflow._router
+            if router is None:
+                import core.router
+                router = JiraDeveloperWorkflow._router = core.router
+            # Nothing consumes the activity log in headless runs - skip building the entry
+            if not router.LISTENERS:
+                return
 
-            core.router.safe_activity_log({
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
+            router.safe_activity_log({
+                "id": activity_id(),
+                "timestamp": iso_now(),
                 "agent": "DeveloperAgent",
                 "action": "Code Generation Completed",
                 "details": f"Generated {file_count} files for {issue_key}",
@@ -98,18 +121,28 @@ class JiraDeveloperWorkflow:
                 "threadId": thread_id
             })
 
-            logger.info(f"[JIRA-DEVELOPER] UI Log: {issue_key} - {file_count} files generated")
+            logger.info("[JIRA-DEVELOPER] UI Log: %s - %s files generated", issue_key, file_count)
         except Exception as e:
-            logger.warning(f"[JIRA-DEVELOPER] Failed to log to UI: {e}")
+            logger.warning("[JIRA-DEVELOPER] Failed to log to UI: %s", e)
 
     def _save_files_locally(self, generated_files: Dict[str, str], issue_key: str):
-        """Save generated files to local filesystem"""
+        """Queue generated files for saving to local filesystem (written by the background artifact writer)"""
+        if os.getenv("LOCAL_STORAGE", "True").lower() != "true":
+            return
         try:
-            from tools.developer_tool import save_files_locally
-            save_files_locally(generated_files, issue_key)
-            logger.info(f"[JIRA-DEVELOPER] Saved {len(generated_files)} files locally for {issue_key}")
+            project_folder = os.path.join("created_project_files", issue_key)
+            for filename, content in generated_files.items():
+                artifact_writer.submit(os.path.join(project_folder, filename), content.encode('utf-8'))
+            logger.info("[JIRA-DEVELOPER] Queued %s files for local save for %s", len(generated_files), issue_key)
         except Exception as e:
-            logger.warning(f"[JIRA-DEVELOPER] Failed to save files locally: {e}")
+            logger.warning("[JIRA-DEVELOPER] Failed to save files locally: %s", e)
+
+    def _post_process(self, generated_files: Dict[str, str], issue_key: str, tokens_used: int, thread_id: str):
+        """Save files, store to MongoDB and log to UI (file writes and Mongo inserts are queued, not awaited)"""
+        files_meta = [{"file": path, "bytes": len(content)} for path, content in generated_files.items()]
+        self._save_files_locally(generated_files, issue_key)
+        self._store_to_mongodb(issue_key, tokens_used, files_meta)
+        self._log_to_ui(issue_key, len(generated_files), thread_id)
 
     def generate_code_for_jira_issue(
         self,
@@ -127,7 +160,7 @@ class JiraDeveloperWorkflow:
             issue_data: JIRA issue data (key, summary, description, etc.)
             thread_id: Optional thread identifier
             feedback: Optional feedback for code correction
-            review_queue: Optional queue for parallel reviewer handoff
+            review_queue: Optional queue for parallel reviewer handoff (queue.SimpleQueue preferred)
 
         Returns:
             {
@@ -140,11 +173,15 @@ class JiraDeveloperWorkflow:
         if not thread_id:
             thread_id = f"JIRA-DEVELOPER-{threading.current_thread().ident}"
 
+        if type(review_queue) is queue.Queue and not JiraDeveloperWorkflow._queue_hint_logged:
+            JiraDeveloperWorkflow._queue_hint_logged = True
+            logger.warning("[JIRA-DEVELOPER] review_queue is a queue.Queue; queue.SimpleQueue avoids per-put locking")
+
         issue_key = issue_data.get('key', 'UNKNOWN')
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
-            logger.info(f"[JIRA-DEVELOPER-{thread_id}] Starting code generation for {issue_key}...")
+            logger.info("[JIRA-DEVELOPER-%s] Starting code generation for %s...", thread_id, issue_key)
 
             # Prepare context with JIRA-specific data
             context = {
@@ -169,9 +206,7 @@ class JiraDeveloperWorkflow:
             tokens_used = result.get("tokens_used", 0)
 
             # JIRA-specific post-processing
-            self._save_files_locally(generated_files, issue_key)
-            self._store_to_mongodb(issue_key, tokens_used)
-            self._log_to_ui(issue_key, len(generated_files), thread_id)
+            self._post_process(generated_files, issue_key, tokens_used, thread_id)
 
             # If review queue provided, push files for parallel review
             if review_queue is not None:
@@ -181,12 +216,12 @@ class JiraDeveloperWorkflow:
                         "issue_data": issue_data,
                         "thread_id": thread_id
                     })
-                    logger.info(f"[JIRA-DEVELOPER-{thread_id}] Pushed files to review queue for {issue_key}")
+                    logger.info("[JIRA-DEVELOPER-%s] Pushed files to review queue for %s", thread_id, issue_key)
                 except Exception as e:
-                    logger.warning(f"[JIRA-DEVELOPER-{thread_id}] Failed to push to review queue: {e}")
+                    logger.warning("[JIRA-DEVELOPER-%s] Failed to push to review queue: %s", thread_id, e)
 
-            elapsed_time = (datetime.now() - start_time).total_seconds()
-            logger.info(f"[JIRA-DEVELOPER-{thread_id}] Completed {issue_key} in {elapsed_time:.2f}s - {len(generated_files)} files, {tokens_used} tokens")
+            elapsed_time = time.perf_counter() - start_time
+            logger.info("[JIRA-DEVELOPER-%s] Completed %s in %.2fs - %s files, %s tokens", thread_id, issue_key, elapsed_time, len(generated_files), tokens_used)
 
             return {
                 "success": True,
@@ -234,7 +269,7 @@ class JiraDeveloperWorkflow:
         issue_key = issue_data.get('key', 'UNKNOWN')
 
         try:
-            logger.info(f"[JIRA-DEVELOPER-{thread_id}] Correcting code for {issue_key}...")
+            logger.info("[JIRA-DEVELOPER-%s] Correcting code for %s...", thread_id, issue_key)
 
             context = {
                 "issue_data": issue_data,
@@ -254,11 +289,9 @@ class JiraDeveloperWorkflow:
                 tokens_used = result.get("tokens_used", 0)
 
                 # Save corrected files
-                self._save_files_locally(corrected_files, issue_key)
-                self._store_to_mongodb(issue_key, tokens_used)
-                self._log_to_ui(issue_key, len(corrected_files), thread_id)
+                self._post_process(corrected_files, issue_key, tokens_used, thread_id)
 
-                logger.info(f"[JIRA-DEVELOPER-{thread_id}] Correction completed for {issue_key}")
+                logger.info("[JIRA-DEVELOPER-%s] Correction completed for %s", thread_id, issue_key)
 
             return result
 
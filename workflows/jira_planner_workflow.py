@@ -9,17 +9,38 @@ It handles:
 
 This keeps JIRA-specific logic separate from the core planning logic.
 """
+import hashlib
 import logging
+import re
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from pymongo import MongoClient
+from bson import encode as bson_encode
+from bson.raw_bson import RawBSONDocument
 
 from agents.core_planner_agent import CorePlannerAgent
 from config.settings import config as app_config
+from workflows._activity import activity_id, buffer_activity, flush_activity, get_router, iso_now
+from workflows._mongo import FEEDBACK_WRITE_CONCERN, BatchedInserter, ensure_feedback_indexes, get_client
 
 logger = logging.getLogger(__name__)
 
+# JIRA fields already passed to the planner as content/identifier/title
+_CONTEXT_EXCLUDED_FIELDS = frozenset({'description', 'key', 'summary'})
+
+# Words skipped when deriving a project key from the issue summary
+_PROJECT_KEY_STOPWORDS = frozenset({'THE', 'A', 'AN', 'AND', 'OR', 'FOR', 'TO', 'OF', 'IN', 'ON'})
+# Characters JIRA does not allow in a project key
+_NON_KEY_CHARS = re.compile(r'[^A-Z0-9]')
+
+# Content-addressed cache of LLM issue summaries, keyed by a hash of the subtask text
+SUMMARY_CACHE_MAX_ENTRIES = 2048
+
+# Upper bound on subtasks summarised/created concurrently when building a project
+PROJECT_CREATION_WORKERS = 8
+
 
 class JiraPlannerWorkflow:
     """
@@ -27,13 +48,22 @@ class JiraPlannerWorkflow:
     Handles JIRA issue processing, MongoDB storage, and UI integration
     """
 
+    # Shared across instances: re-planning the same issue yields the same subtask text
+    _summary_cache: Dict[str, str] = {}
+    _summary_cache_lock = threading.Lock()
+
     def __init__(self, config):
         self.config = config
         self.core_planner = CorePlannerAgent(config)
+        # Built on first issue summary (see _lazy_init_llm) and reused for every subtask
+        self._llm_service = None
+        self._prompt_loader = None
+        self._llm_init_lock = threading.Lock()
 
         # Initialize MongoDB for JIRA-specific storage
         self.mongo_client = None
         self.mongo_collection = None
+        self._inserter = None
         self._initialize_mongodb()
 
         logger.debug("JIRA Planner Workflow initialized")
@@ -46,12 +76,16 @@ class JiraPlannerWorkflow:
                 logger.warning("MONGODB_CONNECTION_STRING not set - JIRA feedback storage disabled")
                 return
 
-            self.mongo_client = MongoClient(conn_str)
+            # Process-wide client shared with the other workflows (never closed per instance)
+            self.mongo_client = get_client()
             # Use MONGODB_PERFORMANCE_DATABASE and MONGODB_AGENT_PERFORMANCE
             db_name = app_config.MONGODB_PERFORMANCE_DATABASE
             coll_name = app_config.MONGODB_AGENT_PERFORMANCE
             db = self.mongo_client[db_name]
-            self.mongo_collection = db[coll_name]
+            # Indexes are created with the default (acknowledged) write concern so failures surface
+            ensure_feedback_indexes(db[coll_name], "JIRA-PLANNER")
+            self.mongo_collection = db.get_collection(coll_name, write_concern=FEEDBACK_WRITE_CONCERN)
+            self._inserter = BatchedInserter(self.mongo_collection, label="JIRA-PLANNER")
 
             logger.debug(f"JIRA Planner MongoDB ready - Database: {db_name}, Collection: {coll_name}")
         except Exception as e:
@@ -60,45 +94,57 @@ class JiraPlannerWorkflow:
 
     def _store_to_mongodb(self, issue_key: str, subtasks: list, model: str, description: str,
                           score: float, tokens_used: int):
-        """Store JIRA-specific planning data to MongoDB"""
+        """
+        Queue JIRA-specific planning data for a batched MongoDB write
+        Batches go out as unordered insert_many with w=0: planner runs are telemetry, so a
+        document lost to a failed write is not retried or reported.
+        """
         if self.mongo_collection is None:
             logger.warning("MongoDB not available - Skipping JIRA planner storage")
             return
 
         try:
+            now = datetime.now()
             document = {
                 "agent_type": "planner",
                 "issue_key": issue_key,
                 "subtasks": subtasks,
-                "timestamp": datetime.now(),
-                "date": datetime.now().date().isoformat(),
+                "timestamp": now,
+                "date": now.date().isoformat(),
                 "llm_model": model,
                 "creation_description": description,
                 "overall_score": score,
                 "tokens_used": tokens_used
             }
 
-            result = self.mongo_collection.insert_one(document)
-            logger.info(f"[JIRA-PLANNER] Stored data for {issue_key} in MongoDB: ID {result.inserted_id}")
+            # Encode now: the buffered copy is an immutable snapshot (callers keep mutating
+            # the returned subtasks) and insert_many sends the raw bytes without re-encoding
+            self._inserter.add(RawBSONDocument(bson_encode(document)))
+            logger.info(f"[JIRA-PLANNER] Queued data for {issue_key} for MongoDB storage")
         except Exception as e:
             logger.error(f"[JIRA-PLANNER] Failed to store in MongoDB: {e}")
 
     def _log_to_ui(self, issue_key: str, subtasks: list, score: float):
-        """Log planning results to UI with detailed score information"""
+        """Buffer planning results for the UI with detailed score information (flushed when plan_jira_issue returns)"""
         try:
-            import core.router
-            import uuid
+            # Nothing consumes the activity log in headless runs - skip building the entry
+            if not get_router().LISTENERS:
+                return
 
-            # Prepare detailed subtask information with scores
-            subtask_details = []
-            for subtask in subtasks:
-                subtask_details.append({
+            # Prepare detailed subtask information and the raw score list in one pass
+            subtask_count = len(subtasks)
+            subtask_details = [None] * subtask_count
+            individual_scores = [None] * subtask_count
+            for i, subtask in enumerate(subtasks):
+                subtask_score = subtask.get("score", 0.0)
+                individual_scores[i] = subtask_score
+                subtask_details[i] = {
                     "id": subtask.get("id"),
                     "description": subtask.get("description", ""),
-                    "score": round(subtask.get("score", 0.0), 1),
+                    "score": round(subtask_score, 1),
                     "priority": subtask.get("priority", 0),
                     "score_reasoning": subtask.get("score_reasoning", "")
-                })
+                }
 
             # Get threshold from config
             threshold = app_config.GOT_SCORE_THRESHOLD
@@ -106,23 +152,23 @@ class JiraPlannerWorkflow:
             # Determine status based on score
             status = "success" if score >= threshold else "warning"
 
-            core.router.safe_activity_log({
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
+            buffer_activity({
+                "id": activity_id(),
+                "timestamp": iso_now(),
                 "agent": "PlannerAgent",
                 "action": "Planning Completed",
-                "details": f"Generated {len(subtasks)} subtasks for {issue_key} | Overall Score: {score:.1f}/{threshold:.1f}",
+                "details": f"Generated {subtask_count} subtasks for {issue_key} | Overall Score: {score:.1f}/{threshold:.1f}",
                 "status": status,
                 "issueId": issue_key,
                 "subtasks": subtask_details,
-                "subtaskCount": len(subtasks),
+                "subtaskCount": subtask_count,
                 "overallScore": round(score, 1),
                 "scoreThreshold": threshold,
-                "individualScores": [st.get("score", 0.0) for st in subtasks],
+                "individualScores": individual_scores,
                 "averageScore": round(score, 1)
             })
 
-            logger.info(f"[JIRA-PLANNER] UI Log: {issue_key} - {len(subtasks)} subtasks, Overall Score: {score:.1f}/{threshold:.1f}")
+            logger.info(f"[JIRA-PLANNER] UI Log: {issue_key} - {subtask_count} subtasks, Overall Score: {score:.1f}/{threshold:.1f}")
         except Exception as e:
             logger.warning(f"[JIRA-PLANNER] Failed to log to UI: {e}")
 
@@ -147,7 +193,7 @@ class JiraPlannerWorkflow:
             thread_id = f"JIRA-PLANNER-{threading.current_thread().ident}"
 
         issue_key = issue_data.get('key', 'UNKNOWN')
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         logger.info(f"[JIRA-PLANNER-{thread_id}] Starting planning for JIRA issue {issue_key}")
 
@@ -160,9 +206,11 @@ class JiraPlannerWorkflow:
                 "project": issue_data.get('project', {}),
                 "priority": issue_data.get('priority', ''),
                 "issue_type": issue_data.get('issuetype', ''),
-                # Include any additional JIRA fields
-                **{k: v for k, v in issue_data.items() if k not in ['description', 'key', 'summary']}
             }
+            # Include any additional JIRA fields
+            for k, v in issue_data.items():
+                if k not in _CONTEXT_EXCLUDED_FIELDS:
+                    context[k] = v
 
             # Call core planner
             result = self.core_planner.plan(
@@ -171,7 +219,7 @@ class JiraPlannerWorkflow:
                 thread_id=thread_id
             )
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             if result.get("success"):
                 subtasks = result.get("subtasks", [])
@@ -188,7 +236,7 @@ class JiraPlannerWorkflow:
                     tokens_used=tokens
                 )
 
-                # Log to UI (JIRA-specific)
+                # Log to UI (JIRA-specific) - buffered and flushed when planning returns
                 self._log_to_ui(issue_key, subtasks, score)
 
                 logger.info(f"[JIRA-PLANNER-{thread_id}] Completed for {issue_key} in {duration:.1f}s")
@@ -216,6 +264,23 @@ class JiraPlannerWorkflow:
                 "needs_human": True,
                 "tokens_used": 0
             }
+        finally:
+            flush_activity()
+
+    def _lazy_init_llm(self):
+        """Create the planner LLMService and PromptLoader once (subtask summaries run on several threads)"""
+        if self._llm_service is not None:
+            return
+        from services.llm_service import LLMService
+        from tools.prompt_loader import PromptLoader
+
+        with self._llm_init_lock:
+            if self._llm_service is None:
+                self._prompt_loader = PromptLoader("prompts")
+                self._llm_service = LLMService(
+                    api_key=app_config.PLANNER_LLM_KEY,
+                    api_url=app_config.PLANNER_LLM_URL
+                )
 
     def _generate_issue_summary_and_description(self, subtask: Dict[str, Any], thread_id: str) -> Dict[str, str]:
         """
@@ -228,9 +293,6 @@ class JiraPlannerWorkflow:
         Returns:
             {"summary": str, "description": str}
         """
-        from services.llm_service import LLMService
-        from tools.prompt_loader import PromptLoader
-
         # Get subtask details
         subtask_desc = subtask.get('description', '')
         subtask_reasoning = subtask.get('score_reasoning', '')
@@ -240,37 +302,40 @@ class JiraPlannerWorkflow:
         if subtask_reasoning and subtask_reasoning != 'No additional details':
             description += f"\n\n{subtask_reasoning}"
 
+        cache_key = hashlib.blake2b(f"{subtask_desc}|{subtask_reasoning}".encode('utf-8'), digest_size=16).hexdigest()
+        with self._summary_cache_lock:
+            cached_summary = self._summary_cache.get(cache_key)
+        if cached_summary is not None:
+            logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Summary cache hit - skipping LLM")
+            return {"summary": cached_summary, "description": description}
+
         try:
-            logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Generating summary via LLM...")
+            logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Generating summary via LLM...")
+
+            self._lazy_init_llm()
 
             # Format prompt
-            prompt_loader = PromptLoader("prompts")
-            formatted_prompt = prompt_loader.format(
+            formatted_prompt = self._prompt_loader.format(
                 "issue_summary_generation",
                 subtask_description=subtask_desc,
                 subtask_reasoning='',
                 priority=''
             )
 
-            # Call LLM for summary only
-            llm_service = LLMService(
-                api_key=app_config.PLANNER_LLM_KEY,
-                api_url=app_config.PLANNER_LLM_URL,
-                model=app_config.PLANNER_LLM_MODEL,
-                temperature=app_config.PLANNER_LLM_TEMPERATURE,
-                max_tokens=app_config.PLANNER_LLM_MAX_TOKENS
-            )
-
-            response = llm_service.chat_completion(
-                messages=[{"role": "user", "content": formatted_prompt}]
-            )
-
-            content = response.get('content', '').strip()
+            # Call LLM for summary only (model, temperature and max tokens come from the PLANNER_LLM_* settings)
+            content, _ = self._llm_service.call_sync(formatted_prompt, agent_name="planner")
+            content = content.strip()
 
             # LLM outputs only the title (no prefix)
             summary = content.split('\n')[0].strip()[:255]  # First line only
 
-            logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Summary: {summary}")
+            logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Summary: {summary}")
+
+            # Bounded, oldest evicted first; fallback summaries below are never cached
+            with self._summary_cache_lock:
+                if len(self._summary_cache) >= SUMMARY_CACHE_MAX_ENTRIES:
+                    self._summary_cache.pop(next(iter(self._summary_cache)))
+                self._summary_cache[cache_key] = summary
 
             return {"summary": summary, "description": description}
 
@@ -300,7 +365,8 @@ class JiraPlannerWorkflow:
                 "error": Optional[str]
             }
         """
-        from tools.jira_client import get_jira_client, create_jira_project_mcp_tool, create_jira_issue_mcp_tool
+        from tools.jira_client import (get_jira_project_keys, create_jira_project_mcp_tool, create_jira_issue_mcp_tool,
+                                       create_jira_issues_mcp_tool)
 
         if not thread_id:
             thread_id = f"JIRA-PROJECT-CREATOR-{threading.current_thread().ident}"
@@ -313,14 +379,14 @@ class JiraPlannerWorkflow:
         try:
             # Generate project key from summary
             words = issue_summary.upper().split()
-            meaningful_words = [w for w in words if w not in ['THE', 'A', 'AN', 'AND', 'OR', 'FOR', 'TO', 'OF', 'IN', 'ON']]
+            meaningful_words = [w for w in words if w not in _PROJECT_KEY_STOPWORDS]
 
             if len(meaningful_words) >= 2:
                 project_key = ''.join([w[0] for w in meaningful_words[:4]])
             elif len(meaningful_words) == 1:
                 project_key = meaningful_words[0][:4]
             else:
-                project_key = ''.join([c for c in issue_summary.upper() if c.isalnum()])[:4]
+                project_key = _NON_KEY_CHARS.sub('', issue_summary.upper())[:4]
 
             if len(project_key) < 2:
                 project_key = project_key + "PR"
@@ -332,14 +398,16 @@ class JiraPlannerWorkflow:
             logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Checking if project {project_key} exists...")
 
             try:
-                jira = get_jira_client()
-                existing_project = jira.project(project_key)
+                project_exists = project_key in get_jira_project_keys()
+            except Exception as e:
+                logger.warning(f"[JIRA-PROJECT-CREATOR-{thread_id}] Could not list JIRA projects: {e}")
+                project_exists = False
 
+            if project_exists:
                 # Project exists! Add tasks to it
                 logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Project {project_key} already exists. Adding tasks to existing project.")
                 created_project_key = project_key
-
-            except Exception as e:
+            else:
                 # Project doesn't exist, create it
                 logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Project doesn't exist. Creating new project: {project_name} ({project_key})")
 
@@ -363,39 +431,54 @@ class JiraPlannerWorkflow:
                 logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Project created successfully: {created_project_key}")
 
             # Create issues for each subtask with LLM-generated summaries and descriptions
-            created_issues = []
-            for idx, subtask in enumerate(subtasks, 1):
-                logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Processing subtask {idx}/{len(subtasks)}...")
+            total = len(subtasks)
+
+            def _summarise(idx: int, subtask: Dict[str, Any]) -> Dict[str, str]:
+                logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Processing subtask {idx}/{total}...")
 
                 # Use LLM to generate proper summary and description
                 generated = self._generate_issue_summary_and_description(subtask, thread_id)
+                generated["issue_type"] = "Task"
+                return generated
 
-                subtask_summary = generated["summary"]
-                subtask_description = generated["description"]
-
-                logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Creating issue {idx}/{len(subtasks)}: {subtask_summary[:50]}...")
-                issue_result = create_jira_issue_mcp_tool(
-                    project_key=created_project_key,
-                    summary=subtask_summary,
-                    description=subtask_description,
-                    issue_type="Task",
-                    thread_id=thread_id
-                )
-
-                if issue_result.get('success'):
-                    created_issues.append(issue_result.get('issue_key'))
-                    logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Created issue: {issue_result.get('issue_key')}")
-                else:
-                    logger.warning(f"[JIRA-PROJECT-CREATOR-{thread_id}] Failed to create issue {idx}: {issue_result.get('error')}")
+            created_issues = []
+            if subtasks:
+                # Summaries are independent LLM round-trips; map() keeps them in subtask order
+                with ThreadPoolExecutor(max_workers=min(PROJECT_CREATION_WORKERS, total),
+                                        thread_name_prefix='jira-project-creator') as pool:
+                    issues = list(pool.map(_summarise, range(1, total + 1), subtasks))
+
+                # One bulk JIRA request for all issues; anything it could not submit is created individually
+                try:
+                    results = create_jira_issues_mcp_tool(project_key=created_project_key, issues=issues,
+                                                          thread_id=thread_id)
+                except Exception as e:
+                    logger.warning(f"[JIRA-PROJECT-CREATOR-{thread_id}] Bulk issue creation failed: {e}")
+                    results = [None] * total
+                for i, issue_result in enumerate(results):
+                    if issue_result is None:
+                        logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Creating issue {i + 1}/{total}: {issues[i]['summary'][:50]}...")
+                        results[i] = create_jira_issue_mcp_tool(
+                            project_key=created_project_key,
+                            summary=issues[i]["summary"],
+                            description=issues[i]["description"],
+                            issue_type=issues[i]["issue_type"],
+                            thread_id=thread_id
+                        )
+
+                for idx, issue_result in enumerate(results, 1):
+                    if issue_result.get('success'):
+                        created_issues.append(issue_result.get('issue_key'))
+                        logger.debug(f"[JIRA-PROJECT-CREATOR-{thread_id}] Created issue: {issue_result.get('issue_key')}")
+                    else:
+                        logger.warning(f"[JIRA-PROJECT-CREATOR-{thread_id}] Failed to create issue {idx}: {issue_result.get('error')}")
 
             logger.info(f"[JIRA-PROJECT-CREATOR-{thread_id}] Project setup complete. Created {len(created_issues)}/{len(subtasks)} issues")
 
             # Log to UI
-            import core.router
-            import uuid
-            core.router.safe_activity_log({
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
+            get_router().safe_activity_log({
+                "id": activity_id(),
+                "timestamp": iso_now(),
                 "agent": "PlannerAgent",
                 "action": "Project Created",
                 "details": f"Created new project {created_project_key} with {len(created_issues)} issues from {issue_key}",
@@ -11,16 +11,103 @@ It handles:
 This keeps JIRA-specific logic separate from the core review logic.
 """
 import logging
+import queue
 import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Union
 
 from agents.core_reviewer_agent import CoreReviewerAgent
 from config.settings import config as app_config
+from tools.reviewer_tool import get_reviewer_tools_stats
+from workflows._activity import activity_id, buffer_activity, flush_activity, get_router, iso_now
 
 logger = logging.getLogger(__name__)
 
+# filename -> source; bytes/memoryview contents are decoded once, just before the core review
+FileContents = Dict[str, Union[str, bytes, memoryview]]
+
+# Per-thread memo of the default reviewer thread id (see _default_thread_id)
+_tid = threading.local()
+
+# Seconds a reviewer blocks waiting for the developer to hand off files
+REVIEW_QUEUE_TIMEOUT = 300
+# Put on a review queue to wake blocked reviewers at shutdown instead of waiting out the timeout
+REVIEW_QUEUE_SENTINEL = None
+
+# Reported by get_workflow_stats (immutable, so shared across calls)
+_WORKFLOW_FEATURES = (
+    "modular_architecture",
+    "core_reviewer_integration",
+    "jira_specific_processing",
+    "parallel_queue_support",
+    "ui_integration",
+    "mongodb_persistence",
+    "multi_dimensional_analysis",
+    "knowledge_base_integration"
+)
+
+# Constant fields of the result returned when a review raises (copied, then filled in per call)
+_FAIL_TEMPLATE = MappingProxyType({
+    "success": False,
+    "overall_score": 0.0,
+    "approved": False,
+    "tokens_used": 0,
+    "mongodb_stored": False,
+    "langgraph_workflow_used": True
+})
+# Constant fields merged into the core reviewer's result on success / on a reported failure
+_SUCCESS_TAIL = MappingProxyType({
+    "langgraph_workflow_used": True,
+    "knowledge_base_used": True,
+    "simplified_workflow": True
+})
+_FAILED_REVIEW_TAIL = MappingProxyType({
+    "langgraph_workflow_used": True,
+    "knowledge_base_used": True
+})
+
+
+def _as_text(files: FileContents) -> Dict[str, str]:
+    """
+    Return files with every value as str, decoding bytes-like contents as UTF-8
+    The review graph builds prompts and pylint inputs from text, so this is the one decode point;
+    an all-str dict is returned as-is without copying.
+    """
+    if all(isinstance(content, str) for content in files.values()):
+        return files
+    return {
+        name: content if isinstance(content, str) else str(content, 'utf-8', 'replace')
+        for name, content in files.items()
+    }
+
+
+def _default_thread_id() -> str:
+    """JIRA-REVIEWER-<ident> for the calling thread, formatted once per thread"""
+    tid = getattr(_tid, "value", None)
+    if tid is None:
+        tid = _tid.value = f"JIRA-REVIEWER-{threading.get_ident()}"
+    return tid
+
+
+def _drain_review_queue(review_queue, batch_size: int, timeout: float = REVIEW_QUEUE_TIMEOUT) -> List[Dict[str, Any]]:
+    """
+    Block for one hand-off, then take up to batch_size - 1 more that are already waiting.
+    A sentinel ends the batch early and is put back so other blocked reviewers wake too.
+    """
+    items = []
+    item = review_queue.get(timeout=timeout)
+    while item is not REVIEW_QUEUE_SENTINEL:
+        items.append(item)
+        if len(items) >= batch_size:
+            return items
+        try:
+            item = review_queue.get_nowait()
+        except queue.Empty:
+            return items
+    review_queue.put(REVIEW_QUEUE_SENTINEL)
+    return items
+
 
 class JiraReviewerWorkflow:
     """
@@ -28,24 +115,47 @@ class JiraReviewerWorkflow:
     Handles JIRA issue processing, queue management, and UI integration
     """
 
+    # Process-wide instances keyed by id(config) (see get_shared); each holds its config, so ids stay unique
+    _shared: Dict[int, "JiraReviewerWorkflow"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, config):
         self.config = config
         self.core_reviewer = CoreReviewerAgent(config)
+        # Approval threshold, resolved once (workflow config first, then app settings)
+        self._threshold = float(getattr(config, 'REVIEW_THRESHOLD', getattr(app_config, 'REVIEW_THRESHOLD', 70.0)))
 
         logger.debug("JIRA Reviewer Workflow initialized")
 
+    @classmethod
+    def get_shared(cls, config) -> "JiraReviewerWorkflow":
+        """
+        Return the process-wide workflow for this config, creating it on first use
+        The CoreReviewerAgent (graph, LLM clients) is then built once and serves every caller
+        concurrently, as it already does for parallel queue reviewers.
+        """
+        key = id(config)
+        workflow = cls._shared.get(key)
+        if workflow is None:
+            with cls._shared_lock:
+                workflow = cls._shared.get(key)
+                if workflow is None:
+                    workflow = cls._shared[key] = cls(config)
+        return workflow
+
     def _log_to_ui(self, issue_key: str, score: float, approved: bool, thread_id: str):
-        """Log review results to UI"""
+        """Buffer review results for the UI (flushed when review_jira_issue_code returns)"""
         try:
-            import core.router
-            import uuid
+            # Nothing consumes the activity log in headless runs - skip building the entry
+            if not get_router().LISTENERS:
+                return
 
             status = "success" if approved else "warning"
-            threshold = app_config.REVIEW_THRESHOLD
+            threshold = self._threshold
 
-            core.router.safe_activity_log({
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
+            buffer_activity({
+                "id": activity_id(),
+                "timestamp": iso_now(),
                 "agent": "ReviewerAgent",
                 "action": "Code Review Completed",
                 "details": f"Review score: {score:.1f}% (Threshold: {threshold:.1f}%) - {'APPROVED' if approved else 'NEEDS_IMPROVEMENT'}",
@@ -57,33 +167,37 @@ class JiraReviewerWorkflow:
                 "threadId": thread_id
             })
 
-            logger.info(f"[JIRA-REVIEWER] UI Log: {issue_key} - Score: {score:.1f}%, Approved: {approved}")
+            logger.info("[JIRA-REVIEWER] UI Log: %s - Score: %.1f%%, Approved: %s", issue_key, score, approved)
         except Exception as e:
-            logger.warning(f"[JIRA-REVIEWER] Failed to log to UI: {e}")
+            logger.warning("[JIRA-REVIEWER] Failed to log to UI: %s", e)
 
     def review_jira_issue_code(
         self,
         issue_key: str,
-        files: Dict[str, str],
+        files: FileContents,
         file_types: List[str],
         project_description: str,
         iteration: int = 1,
         thread_id: Optional[str] = None,
-        review_queue: Optional[Any] = None
+        review_queue: Optional[Any] = None,
+        batch_size: int = 1
     ) -> Dict[str, Any]:
         """
         Review code for a JIRA issue using CoreReviewerAgent
 
         Args:
             issue_key: JIRA issue key
-            files: Dictionary of filename -> code content
+            files: Dictionary of filename -> code content (str, or UTF-8 bytes/memoryview)
             file_types: List of file types being reviewed
             project_description: Description of the project
             iteration: Review iteration number
             thread_id: Optional thread identifier
             review_queue: Optional queue to consume files from (for parallel processing)
+            batch_size: Max queued hand-offs reviewed back to back in this call (queue mode only)
 
         Returns:
+            With batch_size > 1: {"success": bool, "batch_results": [<result per hand-off>]}
+            Otherwise:
             {
                 "success": bool,
                 "overall_score": float,
@@ -95,55 +209,158 @@ class JiraReviewerWorkflow:
             }
         """
         if not thread_id:
-            thread_id = f"JIRA-REVIEWER-{threading.current_thread().ident}"
+            thread_id = _default_thread_id()
+
+        try:
+            return self._review(issue_key, files, file_types, project_description, iteration, thread_id,
+                                review_queue, batch_size)
+        finally:
+            flush_activity()
+
+    def review_from_queue(
+        self,
+        review_queue: Any,
+        issue_key: str = "UNKNOWN",
+        project_description: str = "",
+        file_types: Optional[List[str]] = None,
+        iteration: int = 1,
+        thread_id: Optional[str] = None,
+        batch_size: int = 1,
+        timeout: float = REVIEW_QUEUE_TIMEOUT
+    ) -> Dict[str, Any]:
+        """
+        Review developer hand-offs taken straight from a review queue (parallel processing)
+        Unlike review_jira_issue_code, no fallback files are needed: each hand-off carries its own
+        files and issue data. Returns the same shapes as review_jira_issue_code; if nothing arrives
+        within timeout (or the queue is closed with REVIEW_QUEUE_SENTINEL) the result is the same
+        skipped result as a review with no files.
+
+        Args:
+            review_queue: Queue the developer pushes {"files", "issue_data", "thread_id"} onto
+            issue_key: Issue key used when a hand-off carries no issue data
+            project_description: Project description used when a hand-off carries no issue data
+            file_types: Optional list of file types (inferred from filenames when omitted)
+            iteration: Review iteration number
+            thread_id: Optional thread identifier
+            batch_size: Max queued hand-offs reviewed back to back in this call
+            timeout: Seconds to wait for the first hand-off
+        """
+        if not thread_id:
+            thread_id = _default_thread_id()
+
+        try:
+            items = self._take_from_queue(review_queue, batch_size, timeout, thread_id)
+            if not items:
+                return self._shape_results(
+                    [self._do_review({}, issue_key, project_description, file_types, iteration, thread_id)], batch_size
+                )
+            return self._shape_results([
+                self._review_queue_item(item, {}, issue_key, project_description, file_types, iteration, thread_id)
+                for item in items
+            ], batch_size)
+        finally:
+            flush_activity()
 
-        # Handle review queue if provided (parallel processing)
+    def _review(self, issue_key: str, files: FileContents, file_types: List[str], project_description: str,
+                iteration: int, thread_id: str, review_queue: Optional[Any], batch_size: int) -> Dict[str, Any]:
+        """Queue handling for review_jira_issue_code (UI entries are flushed by the caller)"""
+        # Handle review queue if provided (parallel processing); the passed files are the fallback
         if review_queue is not None:
-            try:
-                logger.info(f"[{thread_id}] Waiting for files from review queue...")
-                queue_data = review_queue.get(timeout=300)  # 5 min timeout
-                files = queue_data.get("files", files)
-                issue_data = queue_data.get("issue_data", {})
-                issue_key = issue_data.get("key", issue_key)
-                project_description = issue_data.get("summary", project_description)
-                retrieved_thread_id = queue_data.get("thread_id", thread_id)
-                logger.info(f"[{thread_id}] Retrieved {len(files)} files from queue for parallel review (original thread: {retrieved_thread_id})")
-            except Exception as e:
-                logger.warning(f"[{thread_id}] Failed to get from review queue: {e}, using provided files")
-
-        start_time = time.time()
+            items = self._take_from_queue(review_queue, batch_size, REVIEW_QUEUE_TIMEOUT, thread_id)
+            if items:
+                return self._shape_results([
+                    self._review_queue_item(item, files, issue_key, project_description, file_types, iteration, thread_id)
+                    for item in items
+                ], batch_size)
+            logger.info("[%s] No hand-off from review queue - using provided files", thread_id)
+
+        return self._shape_results(
+            [self._do_review(files, issue_key, project_description, file_types, iteration, thread_id)], batch_size
+        )
 
+    @staticmethod
+    def _take_from_queue(review_queue: Any, batch_size: int, timeout: float, thread_id: str) -> List[Dict[str, Any]]:
+        """Wait for up to batch_size hand-offs; empty on timeout, shutdown sentinel or queue error"""
         try:
-            logger.info(f"[{thread_id}] Starting JIRA review for {issue_key} (Iteration {iteration})...")
+            logger.info("[%s] Waiting for files from review queue...", thread_id)
+            return _drain_review_queue(review_queue, batch_size, timeout)
+        except Exception as e:
+            logger.warning("[%s] Failed to get from review queue: %s", thread_id, e)
+            return []
+
+    @staticmethod
+    def _shape_results(results: List[Dict[str, Any]], batch_size: int) -> Dict[str, Any]:
+        """A single result as-is for batch_size 1, otherwise {"success", "batch_results"}"""
+        if batch_size == 1:
+            return results[0]
+        return {"success": all(r.get("success") for r in results), "batch_results": results}
+
+    def _review_queue_item(self, queue_data: Dict[str, Any], files: FileContents, issue_key: str,
+                           project_description: str, file_types: Optional[List[str]], iteration: int,
+                           thread_id: str) -> Dict[str, Any]:
+        """Review one developer hand-off taken from the review queue"""
+        # One lookup per field; None/empty values fall back to the caller's defaults
+        files = queue_data.get("files") or files
+        issue_data = queue_data.get("issue_data") or {}
+        issue_key = issue_data.get("key", issue_key)
+        project_description = issue_data.get("summary", project_description)
+        logger.info("[%s] Retrieved %s files from queue for parallel review (original thread: %s)",
+                    thread_id, len(files), queue_data.get("thread_id", thread_id))
+        return self._do_review(files, issue_key, project_description, file_types, iteration, thread_id)
+
+    def _do_review(self, files: FileContents, issue_key: str, project_description: str,
+                   file_types: Optional[List[str]], iteration: int, thread_id: str) -> Dict[str, Any]:
+        """Run CoreReviewerAgent on one set of files and attach the JIRA-specific result fields"""
+        start_time = time.perf_counter()
+
+        # Nothing to review (e.g. empty hand-off and no fallback files) - skip the graph and the UI log
+        if not files:
+            logger.info("[%s] No files to review for %s - skipping", thread_id, issue_key)
+            return {
+                "success": True,
+                "overall_score": 0.0,
+                "threshold": self._threshold,
+                "approved": False,
+                "issues": ["No files to review"],
+                "tokens_used": 0,
+                "files_reviewed": 0,
+                "iteration": iteration,
+                "thread_id": thread_id,
+                "processing_time": time.perf_counter() - start_time,
+                "skipped": True
+            }
+
+        try:
+            logger.info("[%s] Starting JIRA review for %s (Iteration %s)...", thread_id, issue_key, iteration)
 
             # Prepare context with JIRA-specific data
             context = {
                 "identifier": issue_key,
                 "project_description": project_description,
-                "file_types": file_types,
                 "iteration": iteration,
-                "threshold": getattr(self.config, 'REVIEW_THRESHOLD', 70.0)
+                "threshold": self._threshold
             }
+            # Left out when unknown so the core reviewer infers it from the filenames
+            if file_types is not None:
+                context["file_types"] = file_types
 
             # Call core reviewer (without queue - handled externally)
             result = self.core_reviewer.review(
-                files=files,
+                files=_as_text(files),
                 context=context,
                 thread_id=thread_id
             )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             if not result.get("success"):
                 logger.error(f"[{thread_id}] Review failed for {issue_key}: {result.get('error')}")
-                return {
-                    **result,
-                    "iteration": iteration,
-                    "thread_id": thread_id,
-                    "processing_time": processing_time,
-                    "langgraph_workflow_used": True,
-                    "knowledge_base_used": True
-                }
+                # CoreReviewerAgent.review returns a fresh dict, so it is extended in place
+                result.update(_FAILED_REVIEW_TAIL)
+                result["iteration"] = iteration
+                result["thread_id"] = thread_id
+                result["processing_time"] = processing_time
+                return result
 
             # JIRA-specific post-processing
             score = result.get("overall_score", 0.0)
@@ -151,43 +368,32 @@ class JiraReviewerWorkflow:
 
             self._log_to_ui(issue_key, score, approved, thread_id)
 
-            elapsed_time = time.time() - start_time
-            logger.info(f"[{thread_id}] Completed {issue_key} in {elapsed_time:.2f}s - Score: {score:.1f}%, Approved: {approved}")
+            logger.info("[%s] Completed %s in %.2fs - Score: %.1f%%, Approved: %s", thread_id, issue_key, processing_time, score, approved)
 
             # Return formatted results with JIRA-specific fields
-            return {
-                **result,
-                "iteration": iteration,
-                "thread_id": thread_id,
-                "processing_time": processing_time,
-                "langgraph_workflow_used": True,
-                "knowledge_base_used": True,
-                "simplified_workflow": True
-            }
+            result.update(_SUCCESS_TAIL)
+            result["iteration"] = iteration
+            result["thread_id"] = thread_id
+            result["processing_time"] = processing_time
+            return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             logger.error(f"[{thread_id}] JIRA review failed for {issue_key}: {e}")
 
-            return {
-                "success": False,
+            failed = _FAIL_TEMPLATE.copy()
+            failed.update({
                 "error": str(e),
-                "overall_score": 0.0,
-                "threshold": getattr(self.config, 'REVIEW_THRESHOLD', 70.0),
-                "approved": False,
+                "threshold": self._threshold,
                 "issues": [f"Review process failed: {e}"],
-                "tokens_used": 0,
-                "mongodb_stored": False,
                 "iteration": iteration,
                 "thread_id": thread_id,
-                "processing_time": processing_time,
-                "langgraph_workflow_used": True
-            }
+                "processing_time": processing_time
+            })
+            return failed
 
     def get_workflow_stats(self) -> Dict[str, Any]:
         """Get comprehensive workflow statistics"""
-        from tools.reviewer_tool import get_reviewer_tools_stats
-
         core_stats = self.core_reviewer.get_review_stats()
         tool_stats = get_reviewer_tools_stats()
 
@@ -196,14 +402,5 @@ class JiraReviewerWorkflow:
             "version": "2.0_modular",
             "workflow_stats": core_stats,
             "tool_stats": tool_stats,
-            "workflow_features": [
-                "modular_architecture",
-                "core_reviewer_integration",
-                "jira_specific_processing",
-                "parallel_queue_support",
-                "ui_integration",
-                "mongodb_persistence",
-                "multi_dimensional_analysis",
-                "knowledge_base_integration"
-            ]
+            "workflow_features": _WORKFLOW_FEATURES
         }